@@ -0,0 +1,110 @@
+"""
+    Title: Minesweeper Sprite Atlas
+    Description: All game sprites packed into one image that is decoded once; each sprite is cut
+                 from it the first time it is used. Rebuild the atlas after changing a sprite:
+                     python atlas.py
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import json
+import tkinter as tk
+from collections import OrderedDict
+from os import listdir, path
+
+SOURCE_DIR = 'Images/Opaque'
+ATLAS_IMAGE = 'Images/atlas.png'
+ATLAS_INDEX = 'Images/atlas.json'
+ATLAS_WIDTH = 128
+# zoomed sprite sets kept: the one shown and the one before it, so zooming back is instant
+KEEP_SCALES = 2
+
+
+class SpriteAtlas:
+    """Maps a sprite name to its `PhotoImage`. Sprites are sliced out of the atlas on first use and
+    cached, so the game and its dialogs share one copy of each. Without a built atlas the sprites
+    are read from their own files instead, still one at a time as they are needed.
+
+    At a zoom `scale` above 1 each sprite is enlarged from its cached original the first time it
+    is used at that scale, never decoded again. Only the last `KEEP_SCALES` scales are kept, so the
+    memory for sprites is bounded however often the zoom changes. Windows that are not rescaled
+    with the game, such as dialogs, take their sprites from `original`, which are never deleted."""
+    def __init__(self, master, image=ATLAS_IMAGE, index=ATLAS_INDEX, source=SOURCE_DIR):
+        self.master = master
+        self.image = image
+        self.source = source
+        self.sheet = None  # the decoded atlas
+        self.cache = {}
+        self.scale = 1
+        self.scaled = OrderedDict()  # {name: image} of each zoomed scale, least recently used first
+        try:
+            with open(index) as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def __getitem__(self, name):
+        image = self.original(name)
+        if self.scale == 1:
+            return image
+        sprites = self.scaled[self.scale]
+        scaled = sprites.get(name)
+        if scaled is None:
+            scaled = sprites[name] = image.zoom(self.scale)
+        return scaled
+
+    def original(self, name):
+        """Return a sprite at its own size, whatever the zoom"""
+        image = self.cache.get(name)
+        if image is None:
+            image = self.cache[name] = self.load(name)
+        return image
+
+    def set_scale(self, scale):
+        """Serve the sprites zoomed by a whole factor from now on. Images of the scales dropped
+        from the cache are deleted, so nothing may still be showing them."""
+        self.scale = scale
+        if scale == 1:
+            return
+        self.scaled[scale] = self.scaled.pop(scale, {})
+        while len(self.scaled) > KEEP_SCALES:
+            self.scaled.popitem(last=False)
+
+    def load(self, name):
+        """Cut a sprite out of the atlas"""
+        if name not in self.index:
+            return tk.PhotoImage(master=self.master, file=path.join(self.source, name + '.png'))
+        if self.sheet is None:
+            self.sheet = tk.PhotoImage(master=self.master, file=self.image)
+        x, y, width, height = self.index[name]
+        image = tk.PhotoImage(master=self.master, width=width, height=height)
+        image.tk.call(image, 'copy', self.sheet, '-from', x, y, x + width, y + height)
+        return image
+
+
+def build(source=SOURCE_DIR, image=ATLAS_IMAGE, index=ATLAS_INDEX, width=ATLAS_WIDTH):
+    """Pack every sprite in `source` into rows of an atlas image and write the name of each with
+    its (x, y, width, height) to the index. Needs Pillow, which the game itself does not."""
+    from PIL import Image
+
+    sprites = {file[:-4]: Image.open(path.join(source, file)).convert('RGBA') for file in sorted(listdir(source)) if file.endswith('.png')}
+    # tallest first, so each row wastes little height
+    placed = {}
+    x = y = row_height = 0
+    for name, sprite in sorted(sprites.items(), key=lambda item: (-item[1].height, item[0])):
+        if x + sprite.width > width:
+            x, y, row_height = 0, y + row_height, 0
+        placed[name] = [x, y, sprite.width, sprite.height]
+        x += sprite.width
+        row_height = max(row_height, sprite.height)
+    atlas = Image.new('RGBA', (width, y + row_height))
+    for name, (x, y, _, _) in placed.items():
+        atlas.paste(sprites[name], (x, y))
+    atlas.save(image, optimize=True)
+    with open(index, 'w') as f:
+        f.write('{\n' + ',\n'.join(f"  {json.dumps(name)}: {json.dumps(box)}" for name, box in sorted(placed.items())) + '\n}\n')
+    return placed
+
+
+if __name__ == '__main__':
+    placed = build()
+    print(f"packed {len(placed)} sprites into {ATLAS_IMAGE}")
@@ -0,0 +1,63 @@
+"""
+    Title: Board Benchmark
+    Description: Reproducible throughput benchmark for board generation, batch reveals and solved
+                 games on every defined level. Run from the repository root:
+                     python benchmarks/bench_boards.py [--output benchmarks/results.jsonl]
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+import numpy as np
+from board import DEFINED_LEVELS
+from simulate import simulate
+
+# fixed workload so results are comparable between releases
+SEED = 20200529
+BOARDS = 200000
+SOLVER_GAMES = 500
+
+
+def revision():
+    """Return the current git revision, if any"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Board generation and solver throughput benchmark")
+    parser.add_argument('--boards', type=int, default=BOARDS, help="boards generated per level")
+    parser.add_argument('--games', type=int, default=SOLVER_GAMES, help="games played by the solver per level")
+    parser.add_argument('--output', help="append the results as a JSON line to this file")
+    args = parser.parse_args()
+
+    record = {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'revision': revision(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'levels': {},
+    }
+    print(f"{'level':<14}{'boards/sec':>14}{'reveals/sec':>14}{'games/sec':>12}{'win rate':>10}")
+    for name, level in DEFINED_LEVELS.items():
+        stats = simulate(level, args.boards, SEED, solver_sample=args.games)
+        record['levels'][name] = {key: stats[key] for key in ('boards_per_sec', 'reveals_per_sec', 'games_per_sec', 'solver_win_rate')}
+        print(f"{name:<14}{stats['boards_per_sec']:>14,.0f}{stats['reveals_per_sec']:>14,.0f}"
+              f"{stats['games_per_sec']:>12,.1f}{stats['solver_win_rate']:>10.1%}")
+    if args.output:
+        with open(args.output, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+
+
+if __name__ == '__main__':
+    main()
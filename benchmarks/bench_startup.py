@@ -0,0 +1,70 @@
+"""
+    Title: Startup Benchmark
+    Description: Launches the game repeatedly and measures the time to its first frame, from process
+                 start and from the first line of the game module. Needs a display. Run from the
+                 repository root:
+                     python benchmarks/bench_startup.py [--output benchmarks/results.jsonl]
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from os import path
+from time import perf_counter
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+sys.path.insert(0, path.join(ROOT, 'benchmarks'))
+
+from bench_boards import revision
+
+# time to the first frame the game is held to, from process start, in milliseconds
+TARGET_MS = 400
+LAUNCHES = 10
+
+
+def launch():
+    """Start the game once; return the milliseconds to its first frame from process start and
+    from the first line of the game module"""
+    start = perf_counter()
+    output = subprocess.run([sys.executable, 'minesweeper.py', '--first-frame'], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    total = (perf_counter() - start) * 1000
+    # the process still has to exit after printing, so the wall time is an upper bound
+    module = float(output.split(':')[1].split()[0])
+    return total, module
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time to the first frame of the game")
+    parser.add_argument('--launches', type=int, default=LAUNCHES, help="number of times the game is started")
+    parser.add_argument('--target', type=float, default=TARGET_MS, help="fail if the median exceeds this many milliseconds")
+    parser.add_argument('--output', help="append the results as a JSON line to this file")
+    args = parser.parse_args()
+
+    launch()  # warm the file cache
+    totals, modules = zip(*(launch() for _ in range(args.launches)))
+    record = {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'revision': revision(),
+        'python': platform.python_version(),
+        'first_frame_ms': statistics.median(totals),
+        'first_frame_module_ms': statistics.median(modules),
+        'target_ms': args.target,
+    }
+    print(f"{'':<22}{'median':>10}{'min':>10}{'max':>10}")
+    for name, times in (('process start (ms)', totals), ('module start (ms)', modules)):
+        print(f"{name:<22}{statistics.median(times):>10.1f}{min(times):>10.1f}{max(times):>10.1f}")
+    if args.output:
+        with open(args.output, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+    if record['first_frame_ms'] > args.target:
+        print(f"over the target of {args.target:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,422 @@
+"""
+    Title: Minesweeper Board
+    Description: A headless board engine; every cell's state is one byte of a NumPy array
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+from collections import namedtuple
+from functools import lru_cache
+from random import getrandbits
+import numpy as np
+
+Level = namedtuple('Level', 'height width mines')
+
+DEFINED_LEVELS = {
+    'beginner': Level(9, 9, 10),
+    'intermediate': Level(16, 16, 40),
+    'expert': Level(16, 30, 99)
+}
+
+
+def level_name(level):
+    """Return the name of a defined level, or 'custom'"""
+    return next((name for name, defined in DEFINED_LEVELS.items() if defined == level), 'custom')
+
+
+def level_key(level):
+    """Return the key a level is stored under: its name if defined, otherwise `heightxwidthxmines`"""
+    name = level_name(level)
+    return f"{level.height}x{level.width}x{level.mines}" if name == 'custom' else name
+
+
+# the 8-block area surrounding a cell as (row, col) offsets
+OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+ROW_OFFSETS, COL_OFFSETS = np.array(OFFSETS).T
+
+# bits of a cell's state byte; the high four bits hold its count of mine neighbors
+MINE = 1
+REVEALED = 2
+FLAGGED = 4
+QUESTIONED = 8
+MARKED = FLAGGED | QUESTIONED
+COUNT_SHIFT = 4
+
+# the longest side of a board, so that any valid board ID fits in memory
+MAX_SIDE = 2000
+
+# larger boards work out neighbors from the cell indices instead of keeping a table of them,
+# which would take 32 bytes for every cell
+TABLE_CELLS = 1 << 18
+
+
+def neighbor_cells(cells, height, width):
+    """Return the flat indices of the neighbors of `cells` as an array shaped (..., 8); -1 marks
+    a neighbor that falls off the board"""
+    rows, cols = np.divmod(np.asarray(cells, dtype=np.int64)[..., None], width)
+    rows = rows + ROW_OFFSETS
+    cols = cols + COL_OFFSETS
+    valid = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+    return np.where(valid, rows * width + cols, -1)
+
+
+@lru_cache(maxsize=8)
+def neighbor_table(height, width):
+    """Return a read-only (cells, 8) table of flat neighbor indices for a board size; -1 marks
+    a neighbor that falls off the board. Tables are cached so every board of a size shares one."""
+    table = neighbor_cells(np.arange(height * width), height, width).astype(np.int32)
+    table.setflags(write=False)
+    return table
+
+
+def neighbor_counts(mines):
+    """Return the count of adjacent mines for every cell. `mines` is a boolean array shaped
+    (height, width), or (..., height, width) for a stack of boards, summed in one padded pass."""
+    height, width = mines.shape[-2:]
+    padding = [(0, 0)] * (mines.ndim - 2) + [(1, 1), (1, 1)]
+    padded = np.pad(mines.astype(np.uint8), padding)
+    counts = np.zeros(mines.shape, dtype=np.uint8)
+    for dr, dc in OFFSETS:
+        counts += padded[..., 1 + dr:1 + dr + height, 1 + dc:1 + dc + width]
+    return counts
+
+
+def symmetries(height, width):
+    """Return the symmetries of a board size; see `mirror_cells`"""
+    return range(8) if height == width else range(4)
+
+
+def mirror_cells(cells, symmetry):
+    """Return a (height, width) array mirrored by one of the board symmetries: bit 1 flips the
+    rows, bit 2 flips the columns and bit 4 transposes, which only applies to square boards"""
+    if symmetry & 4:
+        cells = cells.T
+    if symmetry & 1:
+        cells = cells[::-1]
+    if symmetry & 2:
+        cells = cells[:, ::-1]
+    return cells
+
+
+def parse_id(board_id):
+    """Split a board ID into (level, first click, seed, safe area, symmetry); see `Board.board_id`"""
+    try:
+        if not isinstance(board_id, str):
+            raise ValueError
+        size, first, seed, *symmetry = board_id.strip().split(':')
+        height, width, mines = (int(n) for n in size.split('x'))
+        safe_area = first.endswith('s')
+        first_click = int(first.rstrip('s'))
+        seed = int(seed, 16)
+        symmetry = int(symmetry[0]) if len(symmetry) == 1 else 0 if not symmetry else -1
+        if not (0 < height <= MAX_SIDE and 0 < width <= MAX_SIDE and 0 < mines < height * width
+                and 0 <= first_click < height * width and symmetry in symmetries(height, width)):
+            raise ValueError
+    except ValueError:
+        raise ValueError(f"Invalid board ID: {board_id!r}") from None
+    return Level(height, width, mines), first_click, seed, safe_area, symmetry
+
+
+class Board:
+    """The mine field for a single game. Cells are addressed by flat index (row * width + col).
+    All of a cell's state is one byte of `state`: the MINE, REVEALED, FLAGGED and QUESTIONED bits
+    and its count of mine neighbors. Whole-board masks such as `mines` are computed on request;
+    single cells are read with `has` and `count`."""
+
+    def __init__(self, level):
+        self.level = level
+        self.height = level.height
+        self.width = level.width
+        self.size = level.height * level.width
+        self.table = neighbor_table(level.height, level.width) if self.size <= TABLE_CELLS else None
+        self.state = np.zeros((level.height, level.width), dtype=np.uint8)
+        self.revealed_count = 0
+        # how the mines were placed; see `board_id`
+        self.seed = None
+        self.first_click = None
+        self.placed_click = None  # the first click before any symmetry is applied
+        self.safe_area = False
+        self.symmetry = 0
+        self.openings = None  # the zero regions of the placed mines; see `opening_labels`
+
+    @classmethod
+    def from_id(cls, board_id):
+        """Regenerate the exact board described by a board ID"""
+        level, first_click, seed, safe_area, symmetry = parse_id(board_id)
+        board = cls(level)
+        board.place_mines(first_click, seed, safe_area)
+        if symmetry:
+            board.mirror(symmetry)
+        return board
+
+    @classmethod
+    def from_state(cls, board_id, first_click, state):
+        """Return the board described by a board ID with the cell states of a game in progress,
+        without placing its mines again. `state` is used as it is, not copied."""
+        level, placed_click, seed, safe_area, symmetry = parse_id(board_id)
+        if state.size != level.height * level.width or not 0 <= first_click < state.size:
+            raise ValueError(f"Saved cells do not fit board {board_id!r}")
+        board = cls(level)
+        board.state = state.reshape(level.height, level.width)
+        board.revealed_count = int(np.count_nonzero(board.state & REVEALED))
+        board.seed = seed
+        board.first_click = first_click
+        board.placed_click = placed_click
+        board.safe_area = safe_area
+        board.symmetry = symmetry
+        return board
+
+    @property
+    def board_id(self):
+        """A compact ID, `heightxwidthxmines:first_click[s]:seed[:symmetry]`, that regenerates this
+        board. The first click is given before any symmetry is applied."""
+        if self.seed is None:
+            return None
+        safe = 's' if self.safe_area else ''
+        symmetry = f":{self.symmetry}" if self.symmetry else ''
+        return f"{self.height}x{self.width}x{self.level.mines}:{self.placed_click}{safe}:{self.seed:x}{symmetry}"
+
+    def copy(self):
+        """Return an independent copy of the board and its state"""
+        board = Board(self.level)
+        board.state = self.state.copy()
+        board.revealed_count = self.revealed_count
+        board.seed = self.seed
+        board.first_click = self.first_click
+        board.safe_area = self.safe_area
+        board.symmetry = self.symmetry
+        board.placed_click = self.placed_click
+        board.openings = self.openings
+        return board
+
+    @property
+    def mines(self):
+        return (self.state & MINE).astype(bool)
+
+    @property
+    def revealed(self):
+        return (self.state & REVEALED).astype(bool)
+
+    @property
+    def flagged(self):
+        return (self.state & FLAGGED).astype(bool)
+
+    @property
+    def questioned(self):
+        return (self.state & QUESTIONED).astype(bool)
+
+    @property
+    def counts(self):
+        return self.state >> COUNT_SHIFT
+
+    def has(self, index, bits):
+        """Return whether a cell, or each of an array of cells, has any of the state `bits`"""
+        return (self.state.flat[index] & bits) != 0
+
+    @property
+    def cleared(self):
+        """True once every cell without a mine is revealed"""
+        return self.revealed_count == self.size - self.level.mines
+
+    def count(self, index):
+        """Return the number of mines around a cell"""
+        return int(self.state.flat[index]) >> COUNT_SHIFT
+
+    def set_mark(self, index, mark=0):
+        """Put a flag or question mark on a cell, or remove its mark with 0"""
+        self.state.flat[index] = (int(self.state.flat[index]) & ~MARKED) | mark
+
+    def cycle_mark(self, index, marks=True):
+        """Right-click a covered cell: flag it, then question mark it if `marks` is on, then clear
+        it. Returns the new mark, or None for a revealed cell, which is left as it is."""
+        if self.has(index, REVEALED):
+            return None
+        if self.has(index, FLAGGED):
+            mark = QUESTIONED if marks else 0
+        elif self.has(index, QUESTIONED):
+            mark = 0
+        else:
+            mark = FLAGGED
+        self.set_mark(index, mark)
+        return mark
+
+    def index(self, row, col):
+        """Return the flat index of a cell"""
+        return row * self.width + col
+
+    def position(self, index):
+        """Return the (row, col) of a flat index"""
+        return divmod(int(index), self.width)
+
+    def neighbor_rows(self, cells):
+        """Return the neighbors of `cells` shaped (..., 8) with -1 off the board, from the table
+        when the board has one"""
+        if self.table is not None:
+            return self.table[cells]
+        return neighbor_cells(cells, self.height, self.width)
+
+    def neighbors(self, index):
+        """Return the flat indices of the cells surrounding `index`"""
+        row = self.neighbor_rows(index)
+        return row[row >= 0]
+
+    def set_mines(self, indices):
+        """Place mines on the cells at the flat `indices` and recompute the neighbor counts"""
+        mines = np.zeros((self.height, self.width), dtype=bool)
+        mines.flat[indices] = True
+        self.state &= MARKED | REVEALED
+        self.state |= mines.view(np.uint8) | (neighbor_counts(mines) << COUNT_SHIFT)
+        self.openings = None
+
+    def place_mines(self, first_click, seed=None, safe_area=False):
+        """Randomly place the level's mines without replacement, never on the first clicked cell or,
+        with `safe_area`, anywhere in its 3x3 area. The layout is fully determined by the seed, a new
+        random one if not given, so the same board can be regenerated from `board_id`."""
+        if seed is None:
+            seed = getrandbits(32)
+        safe = np.zeros(self.size, dtype=bool)
+        safe[first_click] = True
+        if safe_area:
+            safe[self.neighbors(first_click)] = True
+            # a crowded custom level may not leave room to keep the whole area clear
+            safe_area = self.size - safe.sum() >= self.level.mines
+            if not safe_area:
+                safe[self.neighbors(first_click)] = False
+        candidates = np.flatnonzero(~safe)
+        rng = np.random.default_rng(seed)
+        picks = rng.choice(candidates.size, size=min(self.level.mines, candidates.size), replace=False)
+        self.set_mines(candidates[picks])
+        self.seed = seed
+        self.first_click = int(first_click)
+        self.placed_click = self.first_click
+        self.safe_area = bool(safe_area)
+        self.symmetry = 0
+
+    def mirror(self, symmetry):
+        """Mirror the placed mines by one of the board symmetries (see `mirror_cells`). The first
+        click moves with the mines, so a board that is safe to open there stays safe."""
+        if symmetry not in symmetries(self.height, self.width):
+            raise ValueError(f"Invalid symmetry {symmetry} for a {self.height}x{self.width} board")
+        clicks = np.zeros(self.size, dtype=bool)
+        clicks[self.placed_click] = True
+        self.set_mines(np.flatnonzero(mirror_cells(self.mines, symmetry)))
+        self.first_click = int(np.flatnonzero(mirror_cells(clicks.reshape(self.height, self.width), symmetry))[0])
+        self.symmetry = symmetry
+
+    def chord_cells(self, index):
+        """Return the cells a chord on `index` opens: its covered, unflagged neighbors when it is a
+        revealed number with exactly that many flags around it, otherwise none"""
+        neighbors = self.neighbors(index)
+        count = self.count(index)
+        if not self.has(index, REVEALED) or count == 0 or np.count_nonzero(self.has(neighbors, FLAGGED)) != count:
+            return neighbors[:0]
+        return neighbors[~self.has(neighbors, REVEALED | FLAGGED)]
+
+    def mine_indices(self):
+        """Return the flat indices of every mine"""
+        return np.flatnonzero(self.state & MINE)
+
+    def opening_labels(self):
+        """Return the labels of the board's regions of cells with no mine around them (see
+        `metrics.label_openings`), the sorted labels, and the (top, left, bottom, right) box of each
+        region. They depend only on the mines, so they are worked out once and kept with them."""
+        if self.openings is None:
+            from metrics import label_openings
+            labels = label_openings((self.state & MINE == 0) & (self.state >> COUNT_SHIFT == 0))
+            cells = np.flatnonzero(labels < self.size)
+            roots = np.flatnonzero(labels.reshape(-1) == np.arange(self.size))
+            region = np.searchsorted(roots, labels.flat[cells])
+            rows, cols = np.divmod(cells, self.width)
+            boxes = np.zeros((roots.size, 4), dtype=np.int64)
+            boxes[:, 0], boxes[:, 1] = np.divmod(roots, self.width)  # a label is its region's first cell
+            boxes[:, 2], boxes[:, 3] = boxes[:, 0], boxes[:, 1]
+            np.minimum.at(boxes[:, 1], region, cols)
+            np.maximum.at(boxes[:, 2], region, rows)
+            np.maximum.at(boxes[:, 3], region, cols)
+            self.openings = labels, roots, boxes
+        return self.openings
+
+    def opening(self, label):
+        """Return the covered, unflagged cells of the region `label` and of its border, found within
+        the region's box. Returns `None` when a flag or an open cell inside the region would stop a
+        flood from crossing it."""
+        from metrics import neighbor_views
+        labels, roots, boxes = self.opening_labels()
+        top, left, bottom, right = boxes[np.searchsorted(roots, label)].tolist()
+        top, left = max(0, top - 1), max(0, left - 1)
+        bottom, right = min(self.height, bottom + 2), min(self.width, right + 2)
+        region = labels[top:bottom, left:right] == label
+        covered = (self.state[top:bottom, left:right] & (REVEALED | FLAGGED)) == 0
+        if not covered[region].all():
+            return None
+        opened = region.copy()
+        for neighbors in neighbor_views(region, False):
+            opened |= neighbors
+        rows, cols = np.nonzero(opened & covered)
+        return (rows + top) * self.width + cols + left
+
+    def flood(self, cells):
+        """Flood outward from the cells with no mine neighbors by a breadth-first search, one ring
+        of neighbors at a time, and return the cells newly reached. The REVEALED bit doubles as the
+        visited bitmap and flagged cells are never uncovered."""
+        state = self.state.reshape(-1)
+        batches = [cells[:0]]
+        frontier = cells[(state[cells] & MINE == 0) & (state[cells] >> COUNT_SHIFT == 0)]
+        while frontier.size:
+            cells = self.neighbor_rows(frontier).reshape(-1)
+            cells = cells[cells >= 0]
+            cells = np.unique(cells[(state[cells] & (REVEALED | FLAGGED)) == 0])
+            state[cells] |= REVEALED
+            batches.append(cells)
+            frontier = cells[(state[cells] >> COUNT_SHIFT) == 0]
+        return np.concatenate(batches)
+
+    def reveal(self, indices, waves=False):
+        """Reveal the cells at `indices` and flood outward from every cell with no mine neighbors;
+        flagged cells are never uncovered. A flood opens the whole region of cells with no mine
+        neighbors around the cell and the border of that region, so it is cut from the region
+        labels in one step rather than walked ring by ring. A region split by a flag or already
+        partly open is flooded by `flood` instead. Returns the flat indices of all newly revealed
+        cells, the given cells first, so they can be painted in one batch, and adds them to
+        `revealed_count` so a win can be checked without scanning the board. With `waves`, the
+        cells come back as a list of arrays, one for each ring of cells around the first given."""
+        state = self.state.reshape(-1)
+        given = np.asarray(indices, dtype=np.int64).reshape(-1)
+        cells = np.unique(given)
+        cells = cells[(state[cells] & (REVEALED | FLAGGED)) == 0]
+        zero = cells[(state[cells] & MINE == 0) & (state[cells] >> COUNT_SHIFT == 0)]
+        openings = []
+        if zero.size:
+            labels = self.opening_labels()[0]
+            openings = [self.opening(label) for label in np.unique(labels.flat[zero]).tolist()]
+        state[cells] |= REVEALED
+        if any(opening is None for opening in openings):
+            batches = [cells, self.flood(cells)]
+        else:
+            batches = [cells]
+            for opening in openings:
+                opening = opening[(state[opening] & REVEALED) == 0]
+                state[opening] |= REVEALED
+                batches.append(opening)
+        cells = np.concatenate(batches)
+        state[cells] &= ~QUESTIONED & 0xFF
+        self.revealed_count += cells.size
+        if not waves:
+            return cells
+        if not cells.size:
+            return []
+        rows, cols = np.divmod(cells, self.width)
+        row, col = divmod(int(given[0]), self.width)
+        distance = np.maximum(np.abs(rows - row), np.abs(cols - col))
+        order = np.argsort(distance, kind='stable')
+        return np.split(cells[order], np.flatnonzero(np.diff(distance[order])) + 1)
+
+    def clear(self):
+        """Remove all mines, marks and revealed cells from the board"""
+        self.seed = None
+        self.first_click = None
+        self.placed_click = None
+        self.safe_area = False
+        self.symmetry = 0
+        self.state.fill(0)
+        self.revealed_count = 0
+        self.openings = None
@@ -2,29 +2,49 @@
     Title: Minesweeper
     Description: A clone based on the game built by Robert Donner and Curt Johson
     Author: Israel Dryer
-    Modified: 2020-05-29
+    Modified: 2026-10-16
 """
-import tkinter as tk
-from tkinter import messagebox
-from random import choices
-from collections import namedtuple
 from time import perf_counter
-from os import listdir, path
-import pickle
+STARTED = perf_counter()  # for the time to the first frame
+
+import tkinter as tk
+from tkinter import filedialog, messagebox, simpledialog
+from collections import deque
+from datetime import datetime
+from math import ceil
+from os import cpu_count, makedirs, path, remove
 import numpy as np
+from atlas import SpriteAtlas
+from board import Board, Level, DEFINED_LEVELS, MAX_SIDE, level_key, level_name, MINE, REVEALED, FLAGGED, QUESTIONED, COUNT_SHIFT
+from replay import Replay, ReplayRecorder, prune, verify, PRESS, RELEASE, FLAG, MARKS, CHORD
+# the solver, the board pools with their worker processes, the score database and saved games
+# are imported when first used, so they add nothing to the time to the first frame
+
+# image shown for a revealed tile, indexed by its count of mine neighbors
+TILE_IMAGES = ['tile_flat'] + [f'tile_{count}' for count in range(1, 9)]
+
+# the game in progress is saved here to be resumed later
+SAVE_FILE = 'savegame.mss'
+
+# replays of finished games kept in the replays folder; the oldest are deleted first
+KEPT_REPLAYS = 200
+
+# zoom factors of the sprites
+ZOOM_LEVELS = (1, 2, 3, 4)
 
-Level = namedtuple('Level', 'height width mines')
-Score = namedtuple('Score', 'score name')
+# tiles are painted in chunks between events, spending at most this much of a frame on them
+FRAME_BUDGET = 0.008
+PAINT_CHUNK = 64
+# delay between the steps of a rippling opening, in ms
+RIPPLE_MS = 15
 
-DEFINED_LEVELS = {
-    'beginner': Level(9, 9, 10),
-    'intermediate': Level(16, 16, 40),
-    'expert': Level(16, 30, 99)
-}
+# event state bits of the mouse buttons held down
+LEFT_BUTTON = 0x100
+RIGHT_BUTTON = 0x400
 
 class Game(tk.Tk):
 
-    def __init__(self, difficulty):
+    def __init__(self, difficulty, renderer='canvas'):
         super().__init__()
         # remove from screen until fully built
         self.withdraw()
@@ -42,17 +62,25 @@ class Game(tk.Tk):
         self.time_elapsed = 0.0
         self.tiles_visible = 0
         self.move_count = 0
+        self.clicks = 0 # every click on the board, for the efficiency of a round
+        self.metrics = None # the 3BV and openings of the board, measured when its mines are placed
         self.flags = 0
-        self.mine_tiles = []
-        self.checked = []
         self.use_marks = True # question mark on right-click
         self.visible_target = (self.level.height * self.level.width) - self.level.mines
         self.game_over = False
-        self.highscores = self.load_highscores()
+        self.exploded = None # the mine clicked to lose the game
+        self.scores = None # the score database, opened on first use
+        self.player = 'Anonymous' # name recorded with each finished game
+        self.recorder = None # writes the inputs of the current game to a replay
+        self.playback = None # the replay being shown, if any
+        self.executor = None # worker processes for the no-guess board pools
+        self.pools = {}
+        self.next_seed = None # seed of the next round's mines, when set by the automation server
+        self.flash_job = None # the next blink of a hinted tile
+        self.server = None # the automation server, with --serve
 
-        # game images
-        image_files = [(file.split('.')[0], 'Images/Opaque/' + file) for file in listdir('Images/Opaque') if not file.endswith('ico')]
-        self.images = {key: tk.PhotoImage(file=val) for key, val in image_files}
+        # game images, shared with the dialogs
+        self.images = SpriteAtlas(self)
         
         # APPLICATION MENU -------------------------------------------------------------------------
         self.menubar = tk.Menu(self)
@@ -61,6 +89,12 @@ class Game(tk.Tk):
         self.gamemenu = tk.Menu(self.menubar, tearoff=0)
         self.gamemenu.add_command(label='New', accelerator='F2', command=lambda: self.on_reset_release(0))
         self.bind("<Key-F2>", self.on_reset_release)
+        self.gamemenu.add_command(label='Hint', accelerator='H', command=self.on_hint)
+        self.bind("<Key-h>", self.on_hint)
+        self.gamemenu.add_command(label='Save Game', accelerator='Ctrl+S', command=self.on_save_game)
+        self.bind("<Control-s>", self.on_save_game)
+        self.gamemenu.add_command(label='Resume Game', accelerator='Ctrl+R', command=self.on_resume_game)
+        self.bind("<Control-r>", self.on_resume_game)
         self.gamemenu.add_separator()
 
         ### level options
@@ -69,22 +103,49 @@ class Game(tk.Tk):
         self.gamemenu.add_radiobutton(label='Beginner', variable=self.level_var, value=1, command=lambda: self.on_level_select('beginner'))
         self.gamemenu.add_radiobutton(label='Intermediate', variable=self.level_var, value=2, command=lambda: self.on_level_select('intermediate'))
         self.gamemenu.add_radiobutton(label='Expert', variable=self.level_var, value=3, command=lambda: self.on_level_select('expert'))
+        self.gamemenu.add_radiobutton(label='Custom...', variable=self.level_var, value=4, command=lambda: CustomLevel(self))
         self.gamemenu.add_separator()
 
         ### miscellanous game options
         self.marks_var = tk.IntVar()
         self.marks_var.set(1)
         self.gamemenu.add_checkbutton(label='Marks (?)', variable=self.marks_var, command=self.on_toggle_marks)
+        self.no_guess_var = tk.IntVar()
+        self.no_guess_var.set(0)
+        self.gamemenu.add_checkbutton(label='No Guessing', variable=self.no_guess_var, command=self.on_toggle_no_guess)
+        self.ripple_var = tk.IntVar() # openings spread outward step by step
+        self.ripple_var.set(0)
+        self.gamemenu.add_checkbutton(label='Ripple', variable=self.ripple_var)
         self.color_var = tk.IntVar()  # TODO monochrome buttons needed
         self.color_var.set(1)
         self.gamemenu.add_checkbutton(label='Color', variable=self.color_var, command=None, state=tk.DISABLED)
         self.sound_var = tk.IntVar() # TODO try to leverage system sounds
         self.sound_var.set(0)
         self.gamemenu.add_checkbutton(label='Sound', variable=self.sound_var, command=None, state=tk.DISABLED)
+        ### zoom for high resolution screens; also Ctrl+wheel and Ctrl+plus/minus
+        self.zoom_var = tk.IntVar()
+        self.zoom_var.set(1)
+        self.zoommenu = tk.Menu(self.gamemenu, tearoff=0)
+        for scale in ZOOM_LEVELS:
+            self.zoommenu.add_radiobutton(label=f'{scale}x', variable=self.zoom_var, value=scale, command=lambda: self.set_zoom(self.zoom_var.get()))
+        self.gamemenu.add_cascade(label='Zoom', menu=self.zoommenu)
+        self.bind("<Control-MouseWheel>", self.on_zoom_wheel)
+        self.bind("<Control-Button-4>", self.on_zoom_wheel)
+        self.bind("<Control-Button-5>", self.on_zoom_wheel)
+        self.bind("<Control-plus>", lambda _: self.set_zoom(self.images.scale + 1))
+        self.bind("<Control-equal>", lambda _: self.set_zoom(self.images.scale + 1))
+        self.bind("<Control-minus>", lambda _: self.set_zoom(self.images.scale - 1))
         self.gamemenu.add_separator()
 
         # high scores - displays the high scores for beginner, intermediate, and expert.
         self.gamemenu.add_command(label='Best Times...', command=lambda: HighScores(self))
+        self.gamemenu.add_command(label='Statistics...', command=self.on_statistics)
+        self.gamemenu.add_command(label='Board ID...', command=lambda: BoardId(self))
+        self.record_var = tk.IntVar()
+        self.record_var.set(1)
+        self.gamemenu.add_checkbutton(label='Record Replays', variable=self.record_var)
+        self.gamemenu.add_command(label='Open Replay...', command=self.on_open_replay)
+        self.gamemenu.add_command(label='Verify Replay...', command=self.on_verify_replay)
         self.gamemenu.add_separator()
 
         # exit option and main menu setup
@@ -110,351 +171,1260 @@ class Game(tk.Tk):
         self.infobar.grid_columnconfigure(1, weight=1)
         self.infobar.grid_columnconfigure(2, weight=1)
         ## left-side mine counter
-        self.mine_count = tk.Canvas(self.infobar, width=39, height=23, bd=1, relief=tk.SUNKEN)
+        self.mine_count = DigitDisplay(self.infobar, self.images)
         self.mine_count.grid(row=0, column=0, sticky=tk.W)
         ## center reset button
-        self.reset_btn = tk.Label(self.infobar, image=self.images['smile_raised'])
+        self.face = 'smile_raised'
+        self.reset_btn = tk.Label(self.infobar, image=self.images[self.face])
         self.reset_btn.bind("<Button-1>", self.on_reset_press)
         self.reset_btn.bind("<ButtonRelease-1>", self.on_reset_release)
         self.reset_btn.grid(row=0, column=1)
         ## right-side game timer
-        self.timer = tk.Canvas(self.infobar, width=39, height=23, bd=1, relief=tk.SUNKEN)
+        self.timer = DigitDisplay(self.infobar, self.images)
         self.timer.grid(row=0, column=0, sticky=tk.E)
         self.timer.grid(row=0, column=2, sticky=tk.E)
+        self.ticker = Ticker(self, self.on_tick)
         self.reset_infobar()
         # add infobar to root window
         self.infobar.pack(padx=5, pady=(5, 3), fill=tk.X, expand=tk.YES)
 
         # setup the tile grid based on height and width of level
-        self.tile_grid = tk.Frame(self, relief=tk.SUNKEN, bd=3)
+        self.board = Board(self.level)
+        self.pressing = False # the left button is held down on the board
+        self.pressed_tile = None # the tile shown pressed while it is held
+        self.chording = False # both buttons or the middle button are held down
+        self.chord_preview = [] # the tiles shown pressed by a chord
+        self.tile_grid = TileCanvas(self) if renderer == 'canvas' else TileGrid(self)
         self.setup_tile_grid()
 
         # center app on screen
         self.eval("tk::PlaceWindow . center")
         self.deiconify()
 
-    @staticmethod
-    def load_highscores():
-        """Load highscores data if exists, otherwise create file"""
-        if path.exists('highscores.data'):
-            try:
-                with open('highscores.data', 'rb') as f:
-                    return pickle.load(f)
-            except:
-                highscores = {
-                    'beginner': Score(999, 'Anomymous'),
-                    'intermediate': Score(999, 'Anonymous'),
-                    'expert': Score(999, 'Anomymous')
-                    }
-                with open('highscores.data', 'wb') as f:
-                    pickle.dump(highscores, f)
-                return highscores                
-        else:
-            highscores = {
-                'beginner': Score(999, 'Anomymous'),
-                'intermediate': Score(999, 'Anonymous'),
-                'expert': Score(999, 'Anomymous')
-                }
-            with open('highscores.data', 'wb') as f:
-                pickle.dump(highscores, f)
-        return highscores
-            
-    def on_level_select(self, level):
+    def on_level_select(self, difficulty):
         """Menu callback to create level board"""
-        self.level = DEFINED_LEVELS[level]
+        self.set_level(difficulty, DEFINED_LEVELS[difficulty])
+
+    def set_level(self, difficulty, level):
+        """Create the board for a defined or custom level"""
+        self.stop_replay()
+        self.difficulty = difficulty
+        self.level = level
+        self.level_var.set({'beginner': 1, 'intermediate': 2, 'expert': 3}.get(difficulty, 4))
         self.visible_target = (self.level.height * self.level.width) - self.level.mines
-        # remove existing grid and restart
-        for tile in self.tile_array.flatten():
-            tile.destroy()
-        # add new grid with new level settings
+        self.board = Board(self.level)
+        if self.no_guess_var.get():
+            self.board_pool()
+        # replace existing grid with new level settings and restart
         self.setup_tile_grid()
         # reset_infobar
         self.reset_grid()
         self.reset_infobar()
+        self.game_over = False
+
+    def on_toggle_no_guess(self):
+        """Toggle boards that can be cleared without guessing; start filling the pool right away"""
+        if self.no_guess_var.get():
+            self.board_pool()
+
+    def board_pool(self):
+        """Return the no-guess board pool for the current level, starting it on first use. Levels
+        too large to verify in the background have no pool."""
+        from pool import BoardPool, MAX_CELLS
+        if self.level.height * self.level.width > MAX_CELLS:
+            return None
+        if self.level not in self.pools:
+            if self.executor is None:
+                from concurrent.futures import ProcessPoolExecutor
+                self.executor = ProcessPoolExecutor(max_workers=max(1, (cpu_count() or 2) - 1))
+            self.pools[self.level] = BoardPool(self.level, self.executor)
+        return self.pools[self.level]
+
+    def score_store(self):
+        """Return the score database, opening it on first use"""
+        if self.scores is None:
+            from scores import ScoreStore
+            self.scores = ScoreStore()
+        return self.scores
+
+    def destroy(self):
+        """Stop the board pools before closing the window"""
+        for pool in self.pools.values():
+            pool.close()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        self.stop_recording()
+        self.ticker.stop()
+        if self.server is not None:
+            self.server.close()
+        if self.scores is not None:
+            self.scores.close()
+        super().destroy()
 
     def on_toggle_marks(self):
         """Toggle question marks on right-click"""
+        if not self.accepts_input():
+            self.marks_var.set(int(self.use_marks))
+            return
         self.use_marks = True if not self.use_marks else False
+        self.record(MARKS, int(self.use_marks))
 
     def setup_tile_grid(self):
         """Setup the tile grid based on level height and width"""
-        self.tile_array = np.array([], dtype='object')
-        for row in range(self.level.height):
-            for col in range(self.level.width):
-                tile = Tile(self.tile_grid, row, col, self.images['tile_raised'])
-                self.tile_array = np.append(self.tile_array, tile)
-                # button bindings
-                tile.bind("<Button-3>", self.on_rclick_tile)
-                tile.bind("<Button-1>", self.on_lclick_tile)
-                tile.bind("<ButtonRelease-1>", self.on_lclick_tile_release)
-                tile.bind("<Enter>", self.on_mouse_enter)
-                tile.bind("<Leave>", self.on_mouse_leave)
-        # reshape tile array to grid size (height, width)
-        self.tile_array = self.tile_array.reshape((self.level.height, self.level.width))  
+        self.tile_grid.build(self.level.height, self.level.width)
         # add tile grid to root window
-        self.tile_grid.pack(padx=5, pady=(3, 5))                
-
-    def generate_mines(self, event_tile):
-        """Select random tiles as mines and set `is_mine` flag"""
-        tiles = self.tile_array.flatten().tolist()
-        # remove the event tile as an option to prevent player from losing on first click
-        tiles.remove(event_tile)
-        self.mine_tiles = choices(tiles, k=self.level.mines)
-        for tile in self.mine_tiles:
-            tile.is_mine = True
-
-    def assign_neighbor_properties(self):
-        """Assign tile and mine neighbor properties to each tile"""
-        for tile in self.tile_array.flatten():
-            neighbors, mines = self.neighbors(tile)
-            tile.tile_neighbors = neighbors
-            tile.mine_neighbors = mines
-
-    def neighbors(self, tile):
-        """Identify and return valid neighbors"""
-        neighbors = []  # the 8-block area surrounding the target tile
-        offsets = np.array([(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)])
-        for offset in offsets:
+        self.tile_grid.pack(padx=5, pady=(3, 5))
+
+    def generate_mines(self, first_index):
+        """Select random cells as mines on the board. The first clicked cell is excluded to prevent
+        the player from losing on the first click. With no guessing on, a verified board is taken
+        from the pool instead, mirrored so that the first click opens it, or made on the spot when
+        none fits. A replay brings its own."""
+        if self.playback is not None:
+            self.board = self.playback.board.copy()
+            return
+        seed, self.next_seed = self.next_seed, None
+        if not self.no_guess_var.get():
+            self.board.place_mines(first_index, seed)
+            return
+        pool = self.board_pool()
+        if pool is not None and not pool.failed:
+            board = pool.take(first_index)
+            if board is None:
+                # nothing stored fits this click yet; levels small enough for a pool verify quickly
+                from solver import generate_no_guess
+                try:
+                    board = generate_no_guess(self.level, first_index, seed, attempts=1000)
+                except RuntimeError:
+                    pool.failed = True
+            if board is not None:
+                self.board = board
+                return
+        # at least keep the area around the first click clear, and say the board is not verified
+        self.board.place_mines(first_index, seed, safe_area=True)
+        messagebox.showinfo('No Guessing', "No board that can be cleared without guessing could be made "
+                            "for this level. This one may need a guess.", parent=self)
+
+    def play_board(self, board_id):
+        """Start a game on the board regenerated from a board ID, with its first click made"""
+        board = Board.from_id(board_id)
+        self.set_level(level_name(board.level), board.level)
+        self.board = board
+        self.move_count = 1
+        self.clicks = 1
+        self.measure_board()
+        self.pressing = True
+        self.pressed_tile = board.first_click
+        self.start_clock()
+        self.start_recording()
+        self.record(PRESS, board.first_click)
+        self.on_lclick_tile_release(board.first_click)
+
+    def on_save_game(self, _=None):
+        """Save the game in progress so it can be resumed later, even after the game is closed"""
+        if self.move_count == 0 or self.game_over or self.playback is not None:
+            messagebox.showinfo('Save Game', "There is no game in progress to save.", parent=self)
+            return
+        from savegame import save_game
+        try:
+            save_game(SAVE_FILE, self.board, perf_counter() - self.time_started, self.move_count, self.use_marks, self.clicks)
+        except OSError as error:
+            messagebox.showerror('Save Game', str(error), parent=self)
+
+    def on_resume_game(self, _=None):
+        """Go back to the saved game with its board, marks, timer and move count. A save is used up
+        by resuming it, so a lost game cannot be tried again from the same point."""
+        from savegame import load_game
+        try:
+            saved = load_game(SAVE_FILE)
+            remove(SAVE_FILE)
+        except FileNotFoundError:
+            messagebox.showinfo('Resume Game', "There is no saved game.", parent=self)
+            return
+        except (OSError, ValueError) as error:
+            messagebox.showerror('Resume Game', str(error), parent=self)
+            return
+        board = saved.board
+        self.set_level(level_name(board.level), board.level)
+        self.use_marks = saved.marks
+        self.marks_var.set(int(saved.marks))
+        self.restore_game(board, saved.moves, saved.clicks, saved.seconds)
+        self.start_recording(resumed=True)
+
+    def restore_game(self, board, moves, clicks, seconds):
+        """Carry on a game in progress on a board with cells already open or marked"""
+        self.board = board
+        self.move_count = moves
+        self.clicks = clicks
+        self.measure_board()
+        self.tiles_visible = board.revealed_count
+        self.set_mine_count(-int(np.count_nonzero(board.state & FLAGGED)))
+        self.tile_grid.refresh()
+        self.start_clock()
+        self.set_clock(perf_counter() - seconds)
+
+    def start_recording(self, resumed=False):
+        """Start writing the inputs of a new game to the replays folder. A resumed game's replay
+        starts from its cells as they are, so it can be played back and verified like any other."""
+        if not self.record_var.get() or self.playback is not None:
+            return
+        makedirs('replays', exist_ok=True)
+        filename = path.join('replays', f"{datetime.now():%Y%m%d-%H%M%S-%f}-{level_key(self.level)}.msr")
+        if resumed:
+            self.recorder = ReplayRecorder(filename, self.board.board_id, self.use_marks, self.time_started, self.board.state,
+                                           perf_counter() - self.time_started, self.move_count, self.clicks)
+        else:
+            self.recorder = ReplayRecorder(filename, self.board.board_id, self.use_marks, self.time_started)
+
+    def record(self, action, index):
+        """Add an input to the replay being recorded"""
+        if self.recorder is not None:
+            self.recorder.record(action, index)
+
+    def stop_recording(self):
+        """Finish the replay being recorded. Only finished games are kept, and only the newest
+        KEPT_REPLAYS of them."""
+        if self.recorder is not None:
+            self.recorder.close()
+            if self.game_over:
+                prune('replays', KEPT_REPLAYS)
+            else:
+                remove(self.recorder.filename)
+            self.recorder = None
+
+    def accepts_input(self):
+        """False while a replay is shown; only the replay's own inputs are played"""
+        return self.playback is None or self.playback.feeding
+
+    def on_open_replay(self):
+        """Menu callback to watch a recorded game"""
+        filename = filedialog.askopenfilename(parent=self, title='Open Replay', initialdir='replays',
+                                              filetypes=[('Minesweeper replays', '*.msr'), ('All files', '*')])
+        if not filename:
+            return
+        speed = simpledialog.askinteger('Open Replay', "Playback speed (1-100x):", parent=self, initialvalue=1, minvalue=1, maxvalue=100)
+        if speed is None:
+            return
+        try:
+            ReplayPlayer(self, Replay(filename), speed)
+        except (OSError, ValueError) as error:
+            messagebox.showerror('Open Replay', str(error), parent=self)
+
+    def on_verify_replay(self):
+        """Menu callback to play recorded games back headless and report their results"""
+        filenames = filedialog.askopenfilenames(parent=self, title='Verify Replay', initialdir='replays',
+                                                filetypes=[('Minesweeper replays', '*.msr'), ('All files', '*')])
+        lines = []
+        for filename in filenames:
             try:
-                if all(list(map(lambda x: x >= 0, tuple(offset + tile.index)))):
-                    neighbors.append(self.tile_array[tuple(tile.index + offset)])
-            # any index that is out of bounds (negative) or (index error)
-            except IndexError:
+                won, seconds, moves = verify(filename)
+            except (OSError, ValueError) as error:
+                lines.append(f"{path.basename(filename)}: {error}")
                 continue
-        # count of neighbors that are mines
-        mines = self.mine_neighbors(neighbors)
-        return neighbors, mines
+            outcome = 'won' if won else 'lost' if seconds is not None else 'unfinished'
+            time = f" in {seconds:.3f} seconds" if seconds is not None else ''
+            lines.append(f"{path.basename(filename)}: {outcome}{time}, {moves} moves")
+        if lines:
+            messagebox.showinfo('Verify Replay', '\n'.join(lines), parent=self)
 
-    @staticmethod
-    def mine_neighbors(neighbors):
-        """Identify and return count of neighbors that are mines"""
-        mines = map(lambda x: x.is_mine, neighbors)
-        return sum(mines)
+    def stop_replay(self):
+        """Stop showing a replay"""
+        if self.playback is not None:
+            self.playback.stop()
 
-    def visible_tiles(self):
-        """Return a count of visible tiles"""
-        num_visible = sum(list(map(lambda x: x.is_visible, self.tile_array.flatten())))
-        return num_visible
+    def set_face(self, name):
+        """Show a face on the reset button"""
+        self.face = name
+        self.reset_btn['image'] = self.images[name]
+
+    def on_zoom_wheel(self, event):
+        """Zoom in or out one step per Ctrl+wheel notch"""
+        self.set_zoom(self.images.scale + (1 if event.num == 4 or event.delta > 0 else -1))
+
+    def set_zoom(self, scale):
+        """Show every sprite enlarged by a whole factor. The tiles already made are kept and only
+        given their new images, so the board and the game in progress are untouched."""
+        scale = max(ZOOM_LEVELS[0], min(scale, ZOOM_LEVELS[-1]))
+        self.zoom_var.set(scale)
+        if scale == self.images.scale:
+            return
+        self.images.set_scale(scale)
+        self.set_face(self.face)
+        self.mine_count.rescale()
+        self.timer.rescale()
+        self.tile_grid.rescale()
 
     def on_reset_press(self, _):
         """Reset button press callback"""
-        self.reset_btn['image'] = self.images['smile_flat']
+        self.set_face('smile_flat')
 
     def on_reset_release(self, _):
         """Reset button release callback"""
-        self.reset_btn['image'] = self.images['smile_raised']
+        self.set_face('smile_raised')
+        self.stop_replay()
         self.reset_grid()
         self.reset_infobar()
         self.game_over = False
 
     def reset_grid(self):
         """Set or reset the mine grid"""
-        for tile in self.tile_array.flatten():
-            tile.is_visible = False
-            tile.is_mine = False
-            tile.is_flag = False
-            tile.is_question = False
-            tile.tile_neighbors = None
-            tile.mine_neighbors = 0
-            tile['image'] = self.images['tile_raised']
+        self.stop_recording()
+        self.stop_flash()
+        self.tile_grid.reset()
+        self.board.clear()
+        self.exploded = None
+        self.tiles_visible = 0
 
         # general game properties
-        self.checked = []
         self.flags = 0
         self.move_count = 0
-        self.set_timer(reset=True)
+        self.clicks = 0
+        self.metrics = None
+        self.ticker.stop()
 
     def reset_infobar(self):
         """Reset the mine counter and game timer"""
-        # mine counter
-        self.mine_count.create_image(3, 3, anchor=tk.NW, image=self.images['0'])
-        self.mine_count.create_image(16, 3, anchor=tk.NW, image=self.images['0'])
-        self.mine_count.create_image(29, 3, anchor=tk.NW, image=self.images['0'])
         self.set_mine_count(0)
-        # game timer
-        self.timer.create_image(3, 3, anchor=tk.NW, image=self.images['0'])
-        self.timer.create_image(16, 3, anchor=tk.NW, image=self.images['0'])
-        self.timer.create_image(29, 3, anchor=tk.NW, image=self.images['0'])
+        self.timer.set(0)
 
     def set_mine_count(self, increment):
         """Increment mine counter"""
         self.flags -= increment
-        num_string = f"{self.level.mines - self.flags:0>3}"
-        a, b, c = tuple(list(num_string))
-        self.mine_count.create_image(3, 3, anchor=tk.NW, image=self.images[a])
-        self.mine_count.create_image(16, 3, anchor=tk.NW, image=self.images[b])
-        self.mine_count.create_image(29, 3, anchor=tk.NW, image=self.images[c])
-
-    def set_timer(self, reset=False):
-        """Game timer"""
-        # TODO the timer restarts whenever the game is reset; should start at first click of new round
-        if self.time_started == 0 or reset:
-            self.time_started = perf_counter()
-
-        elapsed = f"{perf_counter() - self.time_started:0>3.0f}"
-        digit_1, digit_2, digit_3 = tuple(elapsed)
-
-        self.timer.create_image(3, 3, anchor=tk.NW, image=self.images[digit_1])
-        self.timer.create_image(16, 3, anchor=tk.NW, image=self.images[digit_2])
-        self.timer.create_image(29, 3, anchor=tk.NW, image=self.images[digit_3])
-        if not self.game_over:
-            self.after(1000, self.set_timer) 
-
-    def on_mouse_enter(self, event):
-        """Callback for mouse hover entering tile space."""
-        tile = event.widget
-        # question mark has flat relief on mouse-over
-        if tile.is_question:
-            tile['image'] = self.images['tile_question_flat']
-        elif not any([self.game_over, tile.is_visible, tile.is_flag]):
-            tile['image'] = self.images['tile_flat']
-            
-    def on_mouse_leave(self, event):
-        """Callback for mouse hover leaving tile space. I would like this to show relief when the mouse
-        is held down and dragged across the screen, but now sure how to do this yet. There is no relief
-        for the tile flag, but there is for the question mark, per the original XP version of the game."""
-        # TODO convert this to a <enter> + <Button-1> event
-        tile = event.widget
-        # no relief for tile flag
-        if self.game_over or tile.is_visible or tile.is_flag:
+        self.mine_count.set(self.level.mines - self.flags)
+
+    def start_clock(self):
+        """Start the game timer; a round is timed from its first click"""
+        self.set_clock(perf_counter())
+        self.ticker.start(self.time_started)
+
+    def set_clock(self, started):
+        """Move the start of the round, keeping the game timer in step if it is running"""
+        self.time_started = started
+        if self.ticker.running:
+            self.ticker.start(started)
+
+    def on_tick(self, seconds):
+        """Game timer callback, once a second while a round is being played"""
+        self.timer.set(seconds)
+
+    def set_relief(self, index, pressed):
+        """Show a covered tile pressed or raised. There is no relief for the tile flag, but there is
+        for the question mark, per the original XP version of the game."""
+        if self.board.has(index, REVEALED | FLAGGED):
             return
-        # question mark has relief
-        if tile.is_question:
-            tile['image'] = self.images['tile_question_raised']
+        if self.board.has(index, QUESTIONED):
+            self.tile_grid.set_image(index, 'tile_question_flat' if pressed else 'tile_question_raised')
         else:
-            tile['image'] = self.images['tile_raised']
-            return
+            self.tile_grid.set_image(index, 'tile_flat' if pressed else 'tile_raised')
+
+    def on_mouse_enter(self, index):
+        """Callback for the mouse entering a tile. While the left button is held down the tile under
+        the mouse is shown pressed, so a press can be dragged to another tile before it is released.
+        A chord drags the pressed look of the whole area around the tile."""
+        if self.chording and not self.game_over:
+            self.preview_chord(index)
+        elif self.pressing and not self.game_over:
+            self.pressed_tile = index
+            self.set_relief(index, True)
+
+    def on_mouse_leave(self, index):
+        """Callback for the mouse leaving a tile; a tile pressed by dragging is raised again"""
+        if self.chording and not self.game_over and index in self.chord_preview[:1]:
+            self.preview_chord(None)
+        elif self.pressing and not self.game_over and index == self.pressed_tile:
+            self.pressed_tile = None
+            self.set_relief(index, False)
 
-    def on_rclick_tile(self, event):
+    def on_rclick_tile(self, index):
         """Set or remove flag file tile. The first right-click is a flag, the second is
         a question mark, the 3rd goes back to an empty raised button. Then then repeat."""
-        tile = event.widget
-        if self.game_over:
+        if self.game_over or not self.accepts_input():
             return
-        if not tile.is_visible:
-            if tile.is_flag:
-                tile.is_flag = False
-                if self.use_marks:
-                    tile.is_question = True
-                    tile['image'] = self.images['tile_question_raised']
-                self.set_mine_count(1)
-            elif tile.is_question:
-                tile.is_question = False
-                tile['image'] = self.images['tile_flat']
-            elif self.flags < self.level.mines:
-                tile.is_flag = True
-                tile['image'] = self.images['tile_flag']
-                self.set_mine_count(-1)    
-
-    def on_lclick_tile(self, event):
+        self.record(FLAG, index)
+        self.clicks += 1
+        flagged = self.board.has(index, FLAGGED)
+        if self.board.cycle_mark(index, self.use_marks) is not None:
+            self.tile_grid.set_image(index, self.tile_image(index))
+            # more flags than mines is allowed and shows a negative count, as in the original
+            self.set_mine_count(int(flagged) - int(self.board.has(index, FLAGGED)))
+
+    def on_lclick_tile(self, index):
         """Callback for button press.  The game does not offically start until the first mouse
         click on a grid tile. This generates the tile and starts the timer. The tile in the event
         is passed to the reset grid method to exclude from the random selection of mines. This
         prevents the player for clicking on a mine as the first play and thus ending the game on
         the first click."""
-        tile = event.widget
-        if not self.game_over:
-            # first move of the game
-            if self.move_count == 0:
-                self.reset_grid()
-                self.generate_mines(tile)
-                self.assign_neighbor_properties()
-                self.reset_infobar()
-            self.reset_btn['image'] = self.images['surprise']
-            self.move_count += 1
-
-    def on_lclick_tile_release(self, event):
-        """Callback for button release"""
-        # check if containing widget is event triggering widget
-        tile = event.widget
-        tile_x, tile_y = self.winfo_pointerxy()
-        tile_under_mouse = self.winfo_containing(tile_x, tile_y)
+        if self.game_over or not self.accepts_input():
+            return
+        # first move of the game
+        if self.move_count == 0:
+            self.reset_grid()
+            self.generate_mines(index)
+            self.measure_board()
+            self.reset_infobar()
+            self.start_clock()
+            self.start_recording()
+        self.record(PRESS, index)
+        self.set_face('surprise')
+        self.move_count += 1
+        self.clicks += 1
+        self.pressing = True
+        self.pressed_tile = index
+        self.set_relief(index, True)
+
+    def on_lclick_tile_release(self, index):
+        """Callback for button release. The index is the tile under the mouse on release, which
+        is `None` when the mouse has left the board."""
+        if not self.accepts_input():
+            return
+        pressing, self.pressing = self.pressing, False
+        pressed, self.pressed_tile = self.pressed_tile, None
         if self.game_over:
             return
-        if any([tile != tile_under_mouse, tile.is_visible, tile.is_flag]):
-            self.reset_btn['image'] = self.images['smile_raised']
+        self.record(RELEASE, index)
+        # the press may have been dragged here without the pressed look following it
+        if pressed is not None and pressed != index:
+            self.set_relief(pressed, False)
+        # a press released over any covered tile opens that tile
+        if index is None or not pressing or self.board.has(index, REVEALED | FLAGGED):
+            self.set_face('smile_raised')
+            return
+        self.open_tiles([index])
+
+    def on_chord_press(self, index):
+        """Callback for pressing both buttons, or the middle button, over a tile. The tile and the
+        covered tiles around it are shown pressed until the chord is released."""
+        if self.game_over or not self.accepts_input():
             return
-        if tile.is_mine:
-            self.reset_btn['image'] = self.images['dead']
-            tile.is_question = False
+        # a left press that turned into a chord no longer opens its tile
+        if self.pressed_tile is not None:
+            self.set_relief(self.pressed_tile, False)
+        self.pressing = False
+        self.pressed_tile = None
+        self.chording = True
+        self.set_face('surprise')
+        self.preview_chord(index)
+
+    def preview_chord(self, index):
+        """Move the pressed look of a chord to the area around `index`, or clear it for `None`"""
+        cells = [] if index is None else [index] + self.board.neighbors(index).tolist()
+        for cell in set(self.chord_preview) - set(cells):
+            self.set_relief(cell, False)
+        for cell in set(cells) - set(self.chord_preview):
+            self.set_relief(cell, True)
+        self.chord_preview = cells
+
+    def on_chord_release(self, index):
+        """Callback for releasing a chord. On a revealed number with as many flags around it as its
+        count, every other covered neighbor is opened in one batch."""
+        if not self.accepts_input():
+            return
+        chording, self.chording = self.chording, False
+        self.preview_chord(None)
+        if self.game_over or not chording:
+            return
+        self.record(CHORD, index)
+        self.set_face('smile_raised')
+        if index is None or self.move_count == 0:
+            return
+        self.move_count += 1
+        self.clicks += 1
+        cells = self.board.chord_cells(index)
+        if cells.size:
+            self.open_tiles(cells)
+
+    def open_tiles(self, indices):
+        """Open covered tiles in one batch. A mine among them loses the game; otherwise the tiles
+        and everything they flood are painted in a single pass, then a win is checked."""
+        indices = np.asarray(indices).reshape(-1)
+        mines = indices[self.board.has(indices, MINE)]
+        if mines.size:
+            self.set_face('dead')
             self.game_over = True
-            # uncover all mines
-            for mine in self.mine_tiles:
-                mine['image'] = self.images['tile_mine']
-            # clicked mine is colored red
-            tile['image'] = self.images['tile_explode']
+            self.ticker.stop()
+            # uncover all mines; clicked mine is colored red
+            self.exploded = int(mines[0])
+            self.tile_grid.paint(self.board.mine_indices())
+            self.time_elapsed = perf_counter() - self.time_started
+            self.stop_recording()
+            if self.playback is None:
+                self.score_store().record(level_key(self.level), False, self.time_elapsed, self.player, self.board.board_id, *self.metrics, self.clicks)
 
         else:
-            self.reset_btn['image'] = self.images['smile_raised']
-            self.checked.clear()
-            self.uncover_tile(tile)
+            self.set_face('smile_raised')
+            self.uncover_tile(indices)
 
         # check for win
-        if self.visible_tiles() == self.visible_target:
+        if self.tiles_visible == self.visible_target:
             self.game_over = True
-            self.reset_btn['image'] = self.images['sunglasses']
-            for tile in self.tile_array.flatten():
-                if tile.is_mine:
-                    tile['image'] = self.images['tile_flag']
+            self.ticker.stop()
+            self.set_face('sunglasses')
+            self.tile_grid.paint(self.board.mine_indices())
 
-            # check for highscore and show results
-            self.time_elapsed = int(perf_counter() - self.time_started)
-            self.check_for_highscore()
+            # check for highscore and show results; a replay is not a new game
+            self.time_elapsed = perf_counter() - self.time_started
+            self.stop_recording()
+            if self.playback is None:
+                self.check_for_highscore()
 
-    def check_for_highscore(self):
-        """Determine if user has a high score to record"""
-        current_highscore = self.highscores[self.difficulty].score
-        user_score = self.time_elapsed
-        if user_score < current_highscore:
-            NewHighScore(self, user_score)
-            
-
-    def uncover_tile(self, tile):
-        """Uncover all tiles around the target that are not bombs"""
-        if any([tile in self.checked, tile.is_visible, tile.is_mine]):
+    def measure_board(self):
+        """Measure the 3BV of the board as soon as its mines are placed"""
+        from metrics import board_metrics
+        self.metrics = board_metrics(self.board)
+
+    def on_statistics(self):
+        """Menu callback to show the 3BV of the board and, once it is won, how fast and how
+        efficiently it was cleared"""
+        if self.metrics is None:
+            messagebox.showinfo('Statistics', "Start a game to see its statistics.", parent=self)
             return
-        if tile.mine_neighbors != 0:
-            image = self.images['tile_' + str(tile.mine_neighbors)]
-            tile['image'] = image
-            tile.is_visible = True
-            tile.is_question = False
-            self.checked.append(tile)
+        bv, openings = self.metrics
+        seconds = self.time_elapsed if self.game_over else perf_counter() - self.time_started
+        lines = [f"3BV: {bv}", f"Openings: {openings}", f"Clicks: {self.clicks}", f"Time: {seconds:.2f} seconds"]
+        if self.game_over and self.exploded is None:
+            lines.append(f"3BV/s: {bv / seconds:.2f}")
+            lines.append(f"Efficiency: {bv / self.clicks:.0%} (3BV per click)")
+        messagebox.showinfo('Statistics', '\n'.join(lines), parent=self)
+
+    def on_hint(self, _=None):
+        """Point out a covered tile that the revealed numbers prove is safe"""
+        if self.game_over or self.move_count == 0:
             return
-        
-        tile['image'] = self.images['tile_flat']
-        tile.is_visible = True
-        tile.is_question = False
-        self.checked.append(tile)
-        try:
-            # TODO Why is this try block needed?? What am I missing?
-            for next_tile in tile.tile_neighbors:
-                self.uncover_tile(next_tile)
-        except IndexError:
+        from solver import hint
+        index = hint(self.board)
+        if index is None:
+            messagebox.showinfo('Hint', "No tile can be proven safe. You will have to guess.", parent=self)
+            return
+        self.tile_grid.see(index)
+        self.stop_flash()
+        self.flash_tile(index)
+
+    def flash_tile(self, index, count=6):
+        """Blink a tile between its flat image and its current image"""
+        self.flash_job = None
+        if count == 0 or self.game_over or self.board.has(index, REVEALED):
+            self.tile_grid.paint([index])
             return
+        self.tile_grid.set_image(index, 'tile_flat' if count % 2 == 0 else self.tile_image(index))
+        self.flash_job = self.after(150, self.flash_tile, index, count - 1)
+
+    def stop_flash(self):
+        """Cancel the blinking of a hinted tile; its tile is repainted with the rest of the board"""
+        if self.flash_job is not None:
+            self.after_cancel(self.flash_job)
+            self.flash_job = None
+
+    def check_for_highscore(self):
+        """Record the win and ask for the player's name if it made the level's leaderboard"""
+        from scores import TOP_N
+        scores = self.score_store()
+        game_id = scores.record(level_key(self.level), True, self.time_elapsed, self.player, self.board.board_id, *self.metrics, self.clicks)
+        rank = scores.rank(game_id)
+        if rank <= TOP_N:
+            NewHighScore(self, game_id, rank)
+
+    def uncover_tile(self, index):
+        """Uncover the target tiles and all connected tiles that are not mines in a single batch.
+        The board is updated at once, so a win is seen right away, while the tiles may still be
+        painting."""
+        if self.ripple_var.get():
+            self.tile_grid.ripple(self.board.reveal(index, waves=True))
+        else:
+            self.tile_grid.paint(self.board.reveal(index))
+        self.tiles_visible = self.board.revealed_count
+
+    def tile_image(self, index):
+        """Return the name of the image that shows the current state of a tile"""
+        state = int(self.board.state.flat[index])
+        if state & REVEALED:
+            return TILE_IMAGES[state >> COUNT_SHIFT]
+        if self.game_over and state & MINE:
+            # mines are flagged on a win and uncovered on a loss
+            if self.exploded is None:
+                return 'tile_flag'
+            return 'tile_explode' if index == self.exploded else 'tile_mine'
+        if state & FLAGGED:
+            return 'tile_flag'
+        if state & QUESTIONED:
+            return 'tile_question_raised'
+        return 'tile_raised'
 
     def test_key(self, event):
         """Any key is pressed"""
         print(event)
 
+
+class Ticker:
+    """Calls back with the whole seconds since an origin, once at each second boundary. There is
+    only ever one pending `after` and each tick is scheduled from the clock rather than from the
+    previous tick, so the count never drifts. Nothing runs while stopped or while the window is
+    minimized; on restore the count catches up at once."""
+    def __init__(self, window, callback):
+        self.window = window
+        self.callback = callback
+        self.origin = None  # perf_counter time of second zero while running
+        self.job = None
+        self.paused = False
+        window.bind('<Unmap>', self.on_unmap, add='+')
+        window.bind('<Map>', self.on_map, add='+')
+
+    @property
+    def running(self):
+        return self.origin is not None
+
+    def start(self, origin):
+        """Count from `origin`, replacing any count in progress"""
+        self.cancel()
+        self.origin = origin
+        if not self.paused:
+            self.tick()
+
+    def stop(self):
+        self.cancel()
+        self.origin = None
+
+    def cancel(self):
+        if self.job is not None:
+            self.window.after_cancel(self.job)
+            self.job = None
+
+    def tick(self):
+        """Report the current second and wait for the next boundary"""
+        elapsed = perf_counter() - self.origin
+        seconds = int(elapsed)
+        self.callback(seconds)
+        # rounding up to the millisecond never lands a tick just before its boundary
+        self.job = self.window.after(ceil((seconds + 1 - elapsed) * 1000), self.tick)
+
+    def on_unmap(self, event):
+        """The window was minimized; child widgets being hidden also send this, and are ignored"""
+        if event.widget is self.window and not self.paused:
+            self.paused = True
+            self.cancel()
+
+    def on_map(self, event):
+        if event.widget is self.window and self.paused:
+            self.paused = False
+            if self.running:
+                self.tick()
+
+
+class ReplayPlayer:
+    """Shows a recorded game by feeding its inputs through the game's own handlers. Several inputs
+    are played in one callback when they fall due together, so high speeds do not drift."""
+    def __init__(self, game, replay, speed=1):
+        self.game = game
+        self.speed = speed
+        self.board = replay.board()
+        self.events = iter(replay)
+        self.feeding = False
+        self.job = None
+        game.set_level(level_name(self.board.level), self.board.level)
+        game.use_marks = replay.marks
+        game.marks_var.set(int(replay.marks))
+        game.playback = self
+        # a resumed game is shown from where it was resumed
+        if replay.state is not None:
+            game.restore_game(self.board.copy(), replay.moves, replay.clicks, replay.seconds)
+        self.clock = perf_counter() - replay.seconds / speed
+        self.next = next(self.events, None)
+        self.schedule()
+
+    def due(self, event):
+        """Return the wall clock time an input is played at"""
+        return self.clock + event.time / 1000 / self.speed
+
+    def schedule(self):
+        """Wait for the next input"""
+        if self.next is None:
+            self.stop()
+            return
+        self.job = self.game.after(max(0, int((self.due(self.next) - perf_counter()) * 1000)), self.step)
+
+    def step(self):
+        """Play every input that is due"""
+        now = perf_counter()
+        while self.next is not None and self.due(self.next) <= now:
+            self.play(self.next)
+            self.next = next(self.events, None)
+        self.schedule()
+
+    def play(self, event):
+        """Send one input to the game; the timer shows the time it was made in the recorded game"""
+        game = self.game
+        self.feeding = True
+        try:
+            if event.action == PRESS:
+                game.on_lclick_tile(event.cell)
+            elif event.action == RELEASE:
+                game.on_lclick_tile_release(event.cell)
+            elif event.action == FLAG:
+                game.on_rclick_tile(event.cell)
+            elif event.action == CHORD and event.cell is not None:
+                game.on_chord_press(event.cell)
+                game.on_chord_release(event.cell)
+            elif event.action == MARKS:
+                game.use_marks = bool(event.cell)
+                game.marks_var.set(event.cell)
+        finally:
+            self.feeding = False
+        # after the input, since the first click of a round starts the timer at zero
+        game.set_clock(perf_counter() - event.time / 1000)
+
+    def stop(self):
+        """Stop playing and give the board back to the player"""
+        if self.job is not None:
+            self.game.after_cancel(self.job)
+            self.job = None
+        self.game.playback = None
+
+
+class TileView(tk.Frame):
+    """Base class for the board renderers. Only the tiles inside the viewport are materialized as
+    widgets or canvas items, and each one is a slot that shows whichever board cell is scrolled
+    under it. Scrolling repaints the slots from the game state, so the cost of a redraw depends on
+    the size of the viewport and not on the size of the board. The renderer remembers the image
+    each tile shows and only redraws tiles whose image changes. The tiles are pooled and reused
+    when the level changes. Batches of tiles are queued and painted a frame's budget at a time
+    between events, so input is handled while a large opening is still being drawn."""
+    max_rows = 40
+    max_cols = 60
+
+    def __init__(self, game):
+        super().__init__(game, relief=tk.SUNKEN, bd=3)
+        self.game = game
+        self.tile_size = game.images['tile_raised'].width()
+        self.height = 0  # board size in tiles
+        self.width = 0
+        self.rows = 0  # viewport size in tiles
+        self.cols = 0
+        self.top = 0  # board cell shown in the top-left slot
+        self.left = 0
+        self.hover = None
+        self.chording = False  # both buttons or the middle button are held down
+        self.swallow = False  # ignore the release of the other button after a chord
+        self.pool = []  # tile widgets or canvas items by viewport row and column
+        self.slots = []  # the pooled tiles in the viewport, by slot
+        self.hidden = set()  # pooled tiles outside the viewport
+        self.shown = {}  # name of the image each pooled tile shows
+        self.dirty = set()  # pooled tiles showing anything but a raised tile
+        self.queue = deque()  # (cells, slots, pause) batches waiting to be painted
+        self.paint_job = None
+        self.vbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.on_yscroll)
+        self.hbar = tk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.on_xscroll)
+        # scroll bindings; the board is in every widget's bindtags through the root window
+        game.bind("<MouseWheel>", self.on_mousewheel)
+        game.bind("<Shift-MouseWheel>", self.on_mousewheel)
+        game.bind("<Button-4>", self.on_mousewheel)
+        game.bind("<Button-5>", self.on_mousewheel)
+        game.bind("<Shift-Button-4>", self.on_mousewheel)
+        game.bind("<Shift-Button-5>", self.on_mousewheel)
+        for key in ("<Up>", "<Down>", "<Left>", "<Right>", "<Prior>", "<Next>"):
+            game.bind(key, self.on_scroll_key)
+
+    def build(self, height, width):
+        """Size the viewport for a board of height x width tiles and paint it from the top-left"""
+        self.height = height
+        self.width = width
+        self.top = 0
+        self.left = 0
+        self.hover = None
+        self.layout()
+
+    def layout(self):
+        """Fit the viewport to the board and the screen at the current tile size and paint it"""
+        max_rows = min(self.max_rows, (self.winfo_screenheight() - 200) // self.tile_size)
+        max_cols = min(self.max_cols, (self.winfo_screenwidth() - 100) // self.tile_size)
+        self.rows = min(self.height, max(1, max_rows))
+        self.cols = min(self.width, max(1, max_cols))
+        self.top = max(0, min(self.top, self.height - self.rows))
+        self.left = max(0, min(self.left, self.width - self.cols))
+        self.build_slots(self.rows, self.cols)
+        # scrollbars only when the board does not fit in the viewport
+        if self.rows < self.height:
+            self.vbar.grid(row=0, column=1, sticky=tk.NS)
+        else:
+            self.vbar.grid_remove()
+        if self.cols < self.width:
+            self.hbar.grid(row=1, column=0, sticky=tk.EW)
+        else:
+            self.hbar.grid_remove()
+        self.refresh()
+
+    def rescale(self):
+        """Give every pooled tile the image it shows at the new zoom and refit the viewport. The
+        pool is kept, so nothing is created but the tiles a larger viewport may need."""
+        images = self.game.images
+        self.tile_size = images['tile_raised'].width()
+        for row, line in enumerate(self.pool):
+            for col, tile in enumerate(line):
+                self.draw(tile, images[self.shown[tile]])
+                self.move_tile(tile, row, col)
+        self.hover = None
+        self.layout()
+
+    def build_slots(self, rows, cols):
+        """Size the tile pool for a viewport of rows x cols tiles. Tiles are only made when the pool
+        grows; the ones outside a smaller viewport are hidden and kept for later."""
+        for row in range(rows):
+            if row == len(self.pool):
+                self.pool.append([])
+            line = self.pool[row]
+            while len(line) < cols:
+                tile = self.create_tile(row, len(line), self.game.images['tile_raised'])
+                self.shown[tile] = 'tile_raised'
+                line.append(tile)
+        for row, line in enumerate(self.pool):
+            for col, tile in enumerate(line):
+                visible = row < rows and col < cols
+                if visible == (tile in self.hidden):
+                    self.place_tile(tile, visible)
+                    if visible:
+                        self.hidden.discard(tile)
+                    else:
+                        self.hidden.add(tile)
+        self.slots = [self.pool[row][col] for row in range(rows) for col in range(cols)]
+
+    def create_tile(self, row, col, image):
+        """Create a tile widget or item at a viewport row and column and return it"""
+        raise NotImplementedError
+
+    def place_tile(self, tile, visible):
+        """Show or hide a pooled tile"""
+        raise NotImplementedError
+
+    def draw(self, tile, image):
+        """Set the image of a pooled tile"""
+        raise NotImplementedError
+
+    def move_tile(self, tile, row, col):
+        """Put a pooled tile at its viewport row and column for the current tile size"""
+        raise NotImplementedError
+
+    def set_slot(self, slot, name):
+        """Show the named image in a single slot of the viewport, if it does not already"""
+        tile = self.slots[slot]
+        if self.shown[tile] != name:
+            self.draw(tile, self.game.images[name])
+            self.shown[tile] = name
+            if name == 'tile_raised':
+                self.dirty.discard(tile)
+            else:
+                self.dirty.add(tile)
+
+    def slot(self, index):
+        """Return the viewport slot showing board cell `index`, or `None` if it is out of view"""
+        row, col = divmod(index, self.width)
+        row -= self.top
+        col -= self.left
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row * self.cols + col
+        return None
+
+    def cell(self, slot):
+        """Return the board cell currently shown in a viewport slot"""
+        row, col = divmod(slot, self.cols)
+        return (self.top + row) * self.width + self.left + col
+
+    def see(self, index):
+        """Scroll the viewport, if needed, to bring a board cell into view"""
+        if self.slot(index) is None:
+            row, col = divmod(index, self.width)
+            self.scroll_to(row - self.rows // 2, col - self.cols // 2)
+
+    def set_image(self, index, name):
+        """Set the image of a single tile"""
+        slot = self.slot(index)
+        if slot is not None:
+            self.set_slot(slot, name)
+
+    def paint(self, indices):
+        """Repaint a batch of board cells from the game state, skipping any outside the viewport"""
+        self.queue_cells(indices, 0)
+        self.start_painting()
+
+    def ripple(self, waves):
+        """Repaint the steps of an opening one after another, so that it spreads from the click"""
+        for cells in waves:
+            self.queue_cells(cells, RIPPLE_MS)
+        self.start_painting()
+
+    def queue_cells(self, indices, pause):
+        """Queue the cells of a batch that are in the viewport, to be painted followed by a pause
+        of `pause` ms. The queue is dropped whenever the viewport is repainted in full."""
+        indices = np.asarray(indices).reshape(-1)
+        rows, cols = np.divmod(indices, self.width)
+        rows -= self.top
+        cols -= self.left
+        in_view = (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols)
+        if in_view.any():
+            self.queue.append((indices[in_view], rows[in_view] * self.cols + cols[in_view], pause))
+
+    def start_painting(self):
+        """Paint the first frame of the queue right away, unless it is already being painted"""
+        if self.paint_job is None:
+            self.paint_frame()
+
+    def paint_frame(self):
+        """Paint queued cells in chunks until the frame budget is spent or a batch asks for a pause,
+        then leave the rest to be painted once the events waiting have been handled. Each cell is
+        painted from the game state of the moment, so a cell changed since it was queued is shown
+        as it is now."""
+        self.paint_job = None
+        deadline = perf_counter() + FRAME_BUDGET
+        tile_image = self.game.tile_image
+        while self.queue:
+            cells, slots, pause = self.queue[0]
+            for index, slot in zip(cells[:PAINT_CHUNK].tolist(), slots[:PAINT_CHUNK].tolist()):
+                self.set_slot(slot, tile_image(index))
+            if cells.size > PAINT_CHUNK:
+                self.queue[0] = (cells[PAINT_CHUNK:], slots[PAINT_CHUNK:], pause)
+            else:
+                self.queue.popleft()
+                if pause and self.queue:
+                    self.paint_job = self.after(pause, self.paint_frame)
+                    return
+            if perf_counter() >= deadline:
+                break
+        if self.queue:
+            self.paint_job = self.after_idle(self.paint_frame)
+
+    def cancel_painting(self):
+        """Drop the cells waiting to be painted"""
+        if self.paint_job is not None:
+            self.after_cancel(self.paint_job)
+            self.paint_job = None
+        self.queue.clear()
+
+    def refresh(self):
+        """Repaint every slot in the viewport from the game state"""
+        self.cancel_painting()
+        tile_image = self.game.tile_image
+        for slot in range(self.rows * self.cols):
+            self.set_slot(slot, tile_image(self.cell(slot)))
+        self.vbar.set(self.top / self.height, (self.top + self.rows) / self.height)
+        self.hbar.set(self.left / self.width, (self.left + self.cols) / self.width)
+
+    def reset(self):
+        """Return every tile to the raised image; only the tiles changed since are redrawn"""
+        self.cancel_painting()
+        image = self.game.images['tile_raised']
+        for tile in self.dirty:
+            self.draw(tile, image)
+            self.shown[tile] = 'tile_raised'
+        self.dirty.clear()
+
+    def scroll_to(self, top, left):
+        """Move the viewport so that cell (top, left) is in the top-left slot"""
+        top = max(0, min(top, self.height - self.rows))
+        left = max(0, min(left, self.width - self.cols))
+        if (top, left) != (self.top, self.left):
+            self.top = top
+            self.left = left
+            self.hover = None
+            self.refresh()
+
+    @staticmethod
+    def scroll_target(args, first, visible, total):
+        """Translate a scrollbar command into the first visible row or column"""
+        if args[0] == 'moveto':
+            return round(float(args[1]) * total)
+        step = visible if args[2] == 'pages' else 1
+        return first + int(args[1]) * step
+
+    def on_yscroll(self, *args):
+        self.scroll_to(self.scroll_target(args, self.top, self.rows, self.height), self.left)
+
+    def on_xscroll(self, *args):
+        self.scroll_to(self.top, self.scroll_target(args, self.left, self.cols, self.width))
+
+    def on_mousewheel(self, event):
+        """Scroll three tiles per wheel notch; shift scrolls horizontally"""
+        step = -3 if event.num == 4 or event.delta > 0 else 3
+        if event.state & 0x1:
+            self.scroll_to(self.top, self.left + step)
+        else:
+            self.scroll_to(self.top + step, self.left)
+
+    def on_scroll_key(self, event):
+        """Pan the viewport with the arrow and page keys"""
+        rows, cols = {'Up': (-1, 0), 'Down': (1, 0), 'Left': (0, -1), 'Right': (0, 1),
+                      'Prior': (-self.rows, 0), 'Next': (self.rows, 0)}[event.keysym]
+        self.scroll_to(self.top + rows, self.left + cols)
+
+    def mouse_bindings(self):
+        """Return the (sequence, callback) pairs bound once for the whole board"""
+        return [("<Button-1>", self.on_press), ("<ButtonRelease-1>", self.on_release), ("<Button-3>", self.on_rclick),
+                ("<ButtonRelease-3>", self.on_rrelease), ("<Button-2>", self.on_chord_press), ("<ButtonRelease-2>", self.on_chord_release),
+                ("<Motion>", self.on_motion), ("<Leave>", self.on_motion)]
+
+    def origin(self, widget):
+        """Return the x, y offset of an event's widget from the top-left of the viewport"""
+        raise NotImplementedError
+
+    def cell_at(self, x, y):
+        """Return the board cell at viewport coordinates x, y or `None` if off the board"""
+        row = y // self.tile_size
+        col = x // self.tile_size
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.cell(row * self.cols + col)
+        return None
+
+    def event_cell(self, event):
+        """Return the board cell under the mouse for an event. While a button is held its events go
+        to the widget it was pressed on, with coordinates that may lie over any other tile."""
+        x, y = self.origin(event.widget)
+        return self.cell_at(x + event.x, y + event.y)
+
+    def on_press(self, event):
+        if event.state & RIGHT_BUTTON:
+            self.on_chord_press(event)
+            return
+        index = self.event_cell(event)
+        if index is not None:
+            self.hover = index
+            self.game.on_lclick_tile(index)
+
+    def on_release(self, event):
+        if self.chording:
+            self.on_chord_release(event, other=event.state & RIGHT_BUTTON)
+        elif self.swallow:
+            self.swallow = False
+        else:
+            self.game.on_lclick_tile_release(self.event_cell(event))
+
+    def on_rclick(self, event):
+        if event.state & LEFT_BUTTON:
+            self.on_chord_press(event)
+            return
+        index = self.event_cell(event)
+        if index is not None:
+            self.game.on_rclick_tile(index)
+
+    def on_rrelease(self, event):
+        if self.chording:
+            self.on_chord_release(event, other=event.state & LEFT_BUTTON)
+        else:
+            self.swallow = False
+
+    def on_chord_press(self, event):
+        """Start a chord with the middle button, or with one button pressed while the other is held"""
+        index = self.event_cell(event)
+        if index is not None:
+            self.hover = index
+            self.chording = True
+            self.game.on_chord_press(index)
+
+    def on_chord_release(self, event, other=False):
+        """The chord is played when the first of its buttons is released; the release of the
+        other one is ignored"""
+        if self.chording:
+            self.chording = False
+            self.swallow = bool(other)
+            self.game.on_chord_release(self.event_cell(event))
+
+    def on_motion(self, event):
+        """Report mouse enter and leave as the pointer crosses from one tile to the next; leaving
+        the board is a move to no tile"""
+        index = self.event_cell(event)
+        if index != self.hover:
+            if self.hover is not None:
+                self.game.on_mouse_leave(self.hover)
+            if index is not None:
+                self.game.on_mouse_enter(index)
+            self.hover = index
+
+
+class TileGrid(TileView):
+    """Board renderer with one label widget per tile in the viewport. The labels share a single
+    bind tag, so the board has one set of event bindings however many tiles it shows."""
+    def __init__(self, game):
+        super().__init__(game)
+        self.body = tk.Frame(self)
+        self.body.grid(row=0, column=0)
+        self.tag = f"Tiles{self}"
+        for sequence, callback in self.mouse_bindings():
+            self.bind_class(self.tag, sequence, callback)
+        # keep the root window's tag for the scroll bindings
+        self.tile_tags = (self.tag, str(game), 'all')
+
+    def create_tile(self, row, col, image):
+        tile = Tile(self.body, row, col, image)
+        tile.bindtags(self.tile_tags)
+        return tile
+
+    def place_tile(self, tile, visible):
+        if visible:
+            tile.grid()
+        else:
+            tile.grid_remove()
+
+    def draw(self, tile, image):
+        tile['image'] = image
+
+    def move_tile(self, tile, row, col):
+        pass  # the grid follows the size of the images
+
+    def origin(self, widget):
+        return widget.col * self.tile_size, widget.row * self.tile_size
+
+
 class Tile(tk.Label):
     """Gameboard Tile"""
     def __init__(self, master, row, col, image):
         super().__init__(master, bd=0, image=image)
         self.row = row
         self.col = col
-        self.index = np.array([row, col])
-        self.is_visible = False
-        self.visible_image = None
-        self.is_mine = False
-        self.is_flag = False
-        self.is_question = False
-        self.tile_neighbors = None
-        self.mine_neighbors = 0
         self.grid(row=self.row, column=self.col, sticky=tk.NSEW)
 
-class HighScores(tk.Toplevel):
-    """Popup to show top scores for all levels of the game"""
+
+class TileCanvas(TileView):
+    """Board renderer that draws every tile in the viewport as an image item on a single canvas"""
+    def __init__(self, game):
+        super().__init__(game)
+        self.canvas = tk.Canvas(self, bd=0, highlightthickness=0)
+        self.canvas.grid(row=0, column=0)
+        for sequence, callback in self.mouse_bindings():
+            self.canvas.bind(sequence, callback)
+
+    def build_slots(self, rows, cols):
+        super().build_slots(rows, cols)
+        self.canvas.configure(width=cols * self.tile_size, height=rows * self.tile_size)
+
+    def create_tile(self, row, col, image):
+        return self.canvas.create_image(col * self.tile_size, row * self.tile_size, anchor=tk.NW, image=image)
+
+    def place_tile(self, tile, visible):
+        self.canvas.itemconfigure(tile, state=tk.NORMAL if visible else tk.HIDDEN)
+
+    def draw(self, tile, image):
+        self.canvas.itemconfigure(tile, image=image)
+
+    def move_tile(self, tile, row, col):
+        self.canvas.coords(tile, col * self.tile_size, row * self.tile_size)
+
+    def origin(self, widget):
+        return 0, 0
+
+
+def digit_text(value):
+    """Return the three characters a digit display shows for a value; like the original it is
+    clamped to 999 and negatives show a leading minus down to -99"""
+    value = max(-99, min(int(value), 999))
+    return f"-{-value:0>2}" if value < 0 else f"{value:0>3}"
+
+
+class DigitDisplay(tk.Canvas):
+    """Three digit seven-segment display used for the mine counter and the game timer. The digit
+    images are created once and only reconfigured when a digit changes."""
+    positions = (3, 16, 29)  # left of each digit at 1x
+    def __init__(self, master, images):
+        super().__init__(master, width=39, height=23, bd=1, relief=tk.SUNKEN)
+        self.images = images
+        self.text = '000'
+        self.digits = [self.create_image(x, 3, anchor=tk.NW, image=images['0']) for x in self.positions]
+
+    def set(self, value):
+        """Show a value, reconfiguring only the digits that change; see `digit_text`"""
+        text = digit_text(value)
+        for item, old, new in zip(self.digits, self.text, text):
+            if old != new:
+                self.itemconfigure(item, image=self.images['minus' if new == '-' else new])
+        self.text = text
+
+    def rescale(self):
+        """Resize the display and its digits to the zoom of the images"""
+        scale = self.images.scale
+        self.configure(width=39 * scale, height=23 * scale)
+        for item, x, char in zip(self.digits, self.positions, self.text):
+            self.coords(item, x * scale, 3 * scale)
+            self.itemconfigure(item, image=self.images['minus' if char == '-' else char])
+
+
+class CustomLevel(tk.Toplevel):
+    """Popup to set the height, width and mines of a custom level"""
+    max_side = MAX_SIDE
+
+    def __init__(self, root):
+        super().__init__()
+        self.root = root
+        self.previous = root.level_var.get()
+        self.title('Custom Field')
+        self.iconbitmap('Images/Opaque/winmine.ico')
+        self.resizable(False, False)
+        self.geometry(f'+{root.winfo_x()+20}+{root.winfo_y()+60}')
+        self.protocol("WM_DELETE_WINDOW", self.on_click_cancel)
+
+        self.height_var = tk.StringVar(value=str(root.level.height))
+        self.width_var = tk.StringVar(value=str(root.level.width))
+        self.mines_var = tk.StringVar(value=str(root.level.mines))
+        for row, (text, var) in enumerate([("Height:", self.height_var), ("Width:", self.width_var), ("Mines:", self.mines_var)]):
+            tk.Label(self, text=text, anchor=tk.W).grid(row=row, column=0, sticky=tk.W, padx=(15, 5), pady=(10, 0))
+            tk.Entry(self, textvariable=var, width=8, bg='white').grid(row=row, column=1, sticky=tk.W, padx=(0, 15), pady=(10, 0))
+
+        tk.Button(self, text="OK", command=self.on_click_ok).grid(row=0, column=2, sticky=tk.EW, padx=(0, 15), pady=(10, 0), ipadx=10)
+        tk.Button(self, text="Cancel", command=self.on_click_cancel).grid(row=2, column=2, sticky=tk.EW, padx=(0, 15), pady=(10, 0), ipadx=10)
+        tk.Label(self, text=f"Up to {self.max_side} x {self.max_side} tiles").grid(row=3, column=0, columnspan=3, padx=15, pady=10)
+
+    @staticmethod
+    def read(var, default):
+        """Return the integer value of an entry, or the default if it is not a number"""
+        try:
+            return int(var.get())
+        except ValueError:
+            return default
+
+    def on_click_ok(self):
+        """Callback for ok click; out of range values are clamped as in the original game"""
+        level = self.root.level
+        height = min(max(self.read(self.height_var, level.height), 2), self.max_side)
+        width = min(max(self.read(self.width_var, level.width), 2), self.max_side)
+        mines = min(max(self.read(self.mines_var, level.mines), 1), height * width - 1)
+        self.root.set_level('custom', Level(height, width, mines))
+        self.destroy()
+
+    def on_click_cancel(self):
+        """Callback for cancel click; restore the level selection in the menu"""
+        self.root.level_var.set(self.previous)
+        self.destroy()
+
+
+class BoardId(tk.Toplevel):
+    """Popup with the ID of the current board. Any board ID can be entered to play that board."""
     def __init__(self, root):
+        super().__init__()
+        self.root = root
+        self.title('Board ID')
+        self.iconbitmap('Images/Opaque/winmine.ico')
+        self.resizable(False, False)
+        self.geometry(f'+{root.winfo_x()+20}+{root.winfo_y()+60}')
+
+        tk.Label(self, text="Share this ID to regenerate the board, or enter an ID to play.").pack(padx=15, pady=(15, 5))
+        self.id_var = tk.StringVar(value=root.board.board_id or '')
+        tk.Entry(self, textvariable=self.id_var, width=36, bg='white').pack(padx=15, fill=tk.X)
+        tk.Button(self, text="Close", command=self.destroy).pack(side=tk.RIGHT, ipadx=10, padx=(5, 15), pady=10)
+        tk.Button(self, text="Copy", command=self.on_click_copy).pack(side=tk.RIGHT, ipadx=10, padx=5, pady=10)
+        tk.Button(self, text="Play", command=self.on_click_play).pack(side=tk.RIGHT, ipadx=10, padx=5, pady=10)
+
+    def on_click_copy(self):
+        """Copy the board ID to the clipboard"""
+        self.clipboard_clear()
+        self.clipboard_append(self.id_var.get().strip())
+
+    def on_click_play(self):
+        """Start a game on the entered board"""
+        try:
+            self.root.play_board(self.id_var.get())
+        except ValueError as error:
+            messagebox.showerror('Board ID', str(error), parent=self)
+            return
+        self.destroy()
+
+
+class HighScores(tk.Toplevel):
+    """Popup to show the best time of each level and the leaderboard of any level played"""
+    def __init__(self, root, level=None):
+        from scores import TOP_N
         super().__init__()
         self.geometry(f"+{root.winfo_x()-75}+{root.winfo_y()+110}")
         self.overrideredirect(1)
@@ -464,7 +1434,7 @@ class HighScores(tk.Toplevel):
  
         self.root = root
 
-        for x in range(4):
+        for x in range(6):
             self.grid_rowconfigure(x, weight=1)
         for y in range(4):
             self.grid_columnconfigure(y, weight=1)
@@ -494,60 +1464,79 @@ class HighScores(tk.Toplevel):
         self.level3_name = tk.Label(self, textvariable=self.name3_var, anchor=tk.W)
         self.level3_name.grid(row=2, column=2, sticky=tk.W, padx=15, pady=(0, 10))
 
+        # leaderboard of the chosen level, including custom levels
+        self.level_var = tk.StringVar(value=level or level_key(root.level))
+        tk.Label(self, text="Top times:", anchor=tk.W).grid(row=3, column=0, sticky=tk.W, padx=15)
+        self.level_menu = tk.OptionMenu(self, self.level_var, '')
+        self.level_menu.grid(row=3, column=1, columnspan=2, sticky=tk.W)
+        self.leaderboard = tk.Listbox(self, height=TOP_N, width=48, bg='white', activestyle=tk.NONE)
+        self.leaderboard.grid(row=4, column=0, columnspan=3, sticky=tk.NSEW, padx=15, pady=(5, 0))
+        self.level_var.trace_add('write', lambda *_: self.update_leaderboard())
+
         self.reset_btn = tk.Button(self, text="Reset Scores", command=self.reset_scores)
-        self.reset_btn.grid(row=3, column=1, sticky=tk.NSEW, padx=15, pady=10)
+        self.reset_btn.grid(row=5, column=1, sticky=tk.NSEW, padx=15, pady=10)
         self.ok_btn = tk.Button(self, text="OK", command=self.destroy)
-        self.ok_btn.grid(row=3, column=2, sticky=tk.NSEW, padx=15, pady=10)
+        self.ok_btn.grid(row=5, column=2, sticky=tk.NSEW, padx=15, pady=10)
         # reset scores
         self.update_scores()
 
     def update_scores(self):
         """Update the scores on the popup"""
-        level1 = self.root.highscores['beginner']
-        level2 = self.root.highscores['intermediate']
-        level3 = self.root.highscores['expert']
-        self.score1_var.set(f"{level1.score} seconds")
-        self.score2_var.set(f"{level2.score} seconds")
-        self.score3_var.set(f"{level3.score} seconds")
-        self.name1_var.set(level1.name)
-        self.name2_var.set(level2.name)
-        self.name3_var.set(level3.name)
-    
+        for key, score_var, name_var in [('beginner', self.score1_var, self.name1_var),
+                                         ('intermediate', self.score2_var, self.name2_var),
+                                         ('expert', self.score3_var, self.name3_var)]:
+            best = self.root.score_store().best(key)
+            score_var.set(f"{best.seconds:.2f} seconds" if best else "999 seconds")
+            name_var.set(best.name if best else "Anonymous")
+        # list every level with a win, and always the one being shown
+        menu = self.level_menu['menu']
+        menu.delete(0, tk.END)
+        levels = self.root.score_store().levels()
+        if self.level_var.get() not in levels:
+            levels.append(self.level_var.get())
+        for key in levels:
+            menu.add_radiobutton(label=key.title(), variable=self.level_var, value=key)
+        self.update_leaderboard()
+
+    def update_leaderboard(self):
+        """Show the top times of the chosen level with their 3BV per second, where it is known"""
+        self.leaderboard.delete(0, tk.END)
+        for rank, score in enumerate(self.root.score_store().top(self.level_var.get()), start=1):
+            speed = f"{score.bv / score.seconds:.2f}" if score.bv and score.seconds else '-'
+            self.leaderboard.insert(tk.END, f"{rank:>2}. {score.seconds:>8.2f} {speed:>6}/s  {score.name:<16} {score.played[:10]}")
+
     def reset_scores(self):
-        """reset all scores to anonymous"""
-        # update scores in main file
-        self.root.highscores['beginner'] = Score(999, 'Anonymous')
-        self.root.highscores['intermediate'] = Score(999, 'Anonymous')
-        self.root.highscores['expert'] = Score(999, 'Anonymous')
-        with open('highscores.data', 'wb') as f:
-            pickle.dump(self.root.highscores, f)
+        """Delete every recorded game once the player confirms it"""
+        if not messagebox.askyesno('Reset Scores', "Delete every recorded game, won or lost, on every level?\n\n"
+                                   "This clears the best times, the leaderboards and the whole game history, "
+                                   "and cannot be undone.", icon=messagebox.WARNING, default=messagebox.NO, parent=self):
+            return
+        self.root.score_store().reset()
         self.update_scores()
 
 
 class NewHighScore(tk.Toplevel):
     """A popup to get name of new high scorer"""
-    def __init__(self, root, score):
+    def __init__(self, root, game_id, rank):
         super().__init__()
-        self.new_high = score
+        self.game_id = game_id
         self.root = root
         self.overrideredirect(1)
         self.geometry(f'+{root.winfo_x()}+{root.winfo_y()+110}')
-        tk.Label(self, text="You have the fastest time").pack(padx=20, pady=(15, 0))
-        tk.Label(self, text=f"for {root.difficulty.title()} level.").pack(padx=10, pady=0)
+        place = "the fastest time" if rank == 1 else f"the number {rank} time"
+        tk.Label(self, text=f"You have {place}").pack(padx=20, pady=(15, 0))
+        tk.Label(self, text=f"for {level_key(root.level).title()} level.").pack(padx=10, pady=0)
         tk.Label(self, text="Please enter your name.").pack(padx=15, pady=(0, 10))
         self.name_var = tk.StringVar()
         tk.Entry(self, textvariable=self.name_var, bg='white').pack(padx=10, fill=tk.X)
-        self.name_var.set("Anonymous")
+        self.name_var.set(root.player)
         tk.Button(self, text="OK", command=self.on_click_ok).pack(ipadx=10, pady=10)
 
     def on_click_ok(self):
         """Callback for ok click"""
-        difficulty = self.root.difficulty
-        name = self.name_var.get()
-        self.root.highscores[self.root.difficulty] = Score(self.new_high, name)
-        # save new scores to file
-        with open('highscores.data', 'wb') as f:
-            pickle.dump(self.root.highscores, f)
+        name = self.name_var.get().strip() or 'Anonymous'
+        self.root.player = name
+        self.root.score_store().rename(self.game_id, name)
         # show new highscores
         HighScores(self.root)
         self.destroy()
@@ -561,8 +1550,7 @@ class AboutMinesweeper(tk.Toplevel):
         self.iconbitmap('Images/Opaque/winmine.ico')
         self.geometry(f'325x200+{root.winfo_x()-75}+{root.winfo_y()}')
 
-        self.logo_img = tk.PhotoImage(file='./Images/Opaque/winmine.png')
-        self.logo = tk.Label(self, image=self.logo_img, anchor=tk.W)
+        self.logo = tk.Label(self, image=root.images.original('winmine'), anchor=tk.W)
         self.logo.pack(side=tk.TOP, fill=tk.X, padx=10, pady=10)
 
         self.text = tk.Text(self, height=4)
@@ -578,9 +1566,50 @@ class AboutMinesweeper(tk.Toplevel):
         
 
         
+def profile_game():
+    """Return a profiler wrapped around the game's callbacks, the renderers and the board engine"""
+    from profiling import Profiler
+
+    profiler = Profiler()
+    profiler.time_calls(Game, ['on_lclick_tile', 'on_lclick_tile_release', 'on_rclick_tile', 'on_chord_press', 'on_chord_release',
+                               'on_mouse_enter', 'on_mouse_leave', 'on_reset_release', 'set_level', 'on_hint', 'on_tick',
+                               'generate_mines', 'reset_grid', 'open_tiles', 'uncover_tile'])
+    profiler.time_calls(TileView, ['paint', 'paint_frame', 'refresh', 'reset', 'rescale', 'scroll_to', 'on_motion'])
+    profiler.time_calls(Board, ['reveal'])
+    for renderer in (TileGrid, TileCanvas):
+        profiler.count_calls(renderer, ['create_tile', 'place_tile', 'draw'])
+    profiler.count_calls(DigitDisplay, ['itemconfigure'])
+    return profiler
+
+
 if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="A clone of the Windows XP Minesweeper")
+    parser.add_argument('--first-frame', action='store_true', help="print the time to the first frame and exit")
+    parser.add_argument('--profile', nargs='?', const='profile.json', metavar='FILE',
+                        help="time the callbacks, show live stats and write them to FILE on exit (default profile.json)")
+    parser.add_argument('--serve', nargs='?', const='localhost:8765', metavar='ADDRESS',
+                        help="let bots play this game over a local socket, host:port or unix:path (default localhost:8765)")
+    args = parser.parse_args()
 
+    profiler = profile_game() if args.profile else None
     game = Game('beginner')
-    #NewHighScore(game, 120)
-    game.mainloop()
+    if profiler is not None:
+        profiler.attach(game)
+    if args.serve:
+        from server import Server, GameSession
+        session = GameSession(game)
+        game.server = Server(args.serve, lambda: session)
+        game.server.attach(game)
+    if args.first_frame:
+        # the window is on screen and its widgets drawn
+        game.wait_visibility()
+        game.update_idletasks()
+        print(f"first frame: {(perf_counter() - STARTED) * 1000:.1f} ms")
+        game.destroy()
+    else:
+        game.mainloop()
+    if profiler is not None:
+        profiler.dump(args.profile)
 
@@ -0,0 +1,141 @@
+"""
+    Title: Minesweeper Board Pool
+    Description: Keeps a memory-mapped store of verified no-guess boards per level, refilled in the
+                 background by a pool of worker processes
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import struct
+import threading
+from os import makedirs, path
+from random import getrandbits
+import numpy as np
+from board import Board, mirror_cells, symmetries
+from solver import generate_no_guess
+
+MAGIC = b'MSPOOL01'
+HEADER = struct.Struct('<8sIIII')  # magic, height, width, mines, capacity
+HEADER_SIZE = 64
+EMPTY, READY = 0, 1
+# largest board the solver is asked to verify in the background
+MAX_CELLS = 4096
+
+
+def record_dtype(level):
+    """Return the dtype of one stored board: a ready flag, how it was placed, and the bit-packed
+    mines and opening of the first click"""
+    nbytes = (level.height * level.width + 7) // 8
+    return np.dtype([('state', 'u1'), ('first_click', '<u4'), ('seed', '<u4'),
+                     ('mines', 'u1', (nbytes,)), ('opening', 'u1', (nbytes,))])
+
+
+def build_board(level, seed):
+    """Worker process task: generate one no-guess board opened from a random first click. Returns
+    its placement and the bit-packed mines and opening. The opening is every zero cell flooded by
+    the first click; a click on any of them opens the board the same way."""
+    rng = np.random.default_rng(seed)
+    first_click = int(rng.integers(level.height * level.width))
+    board = generate_no_guess(level, first_click, int(rng.integers(2 ** 32)))
+    opened = board.copy()
+    opened.reveal(first_click)
+    opening = opened.revealed & (opened.counts == 0)
+    return board.first_click, board.seed, np.packbits(board.mines), np.packbits(opening)
+
+
+class BoardPool:
+    """A fixed number of slots holding no-guess boards for one level, kept in a memory-mapped file
+    so boards survive between sessions and opening the store reads nothing up front. Worker
+    processes fill empty slots in the background. A board is taken by mirroring a stored one so
+    that the clicked cell falls inside its opening."""
+    def __init__(self, level, executor, directory='pools', capacity=32):
+        self.level = level
+        self.executor = executor
+        self.capacity = capacity
+        self.lock = threading.RLock()
+        self.pending = 0
+        self.failed = False
+        self.closed = False
+        self.path = path.join(directory, f"{level.height}x{level.width}x{level.mines}.pool")
+        makedirs(directory, exist_ok=True)
+        dtype = record_dtype(level)
+        header = HEADER.pack(MAGIC, level.height, level.width, level.mines, capacity)
+        if not self.valid_file(header, dtype):
+            with open(self.path, 'wb') as f:
+                f.write(header.ljust(HEADER_SIZE, b'\0'))
+                f.truncate(HEADER_SIZE + dtype.itemsize * capacity)
+        self.records = np.memmap(self.path, dtype=dtype, mode='r+', offset=HEADER_SIZE, shape=(capacity,))
+        self.refill()
+
+    def valid_file(self, header, dtype):
+        """True if the pool file exists and was written for this level and capacity"""
+        if not path.exists(self.path) or path.getsize(self.path) != HEADER_SIZE + dtype.itemsize * self.capacity:
+            return False
+        with open(self.path, 'rb') as f:
+            return f.read(HEADER.size) == header
+
+    def ready(self):
+        """Return the number of boards ready to play"""
+        return int(np.count_nonzero(self.records['state'] == READY))
+
+    def refill(self):
+        """Queue a board for every empty slot not already being generated"""
+        with self.lock:
+            if self.closed or self.failed:
+                return
+            wanted = self.capacity - self.ready() - self.pending
+            for _ in range(wanted):
+                future = self.executor.submit(build_board, self.level, getrandbits(32))
+                future.add_done_callback(self.on_board_built)
+                self.pending += 1
+
+    def on_board_built(self, future):
+        """Store a finished board in an empty slot; runs on the executor's callback thread"""
+        with self.lock:
+            self.pending -= 1
+            if self.closed or future.cancelled():
+                return
+            if future.exception() is not None:
+                # the level is too crowded to clear without guessing; stop asking for boards
+                self.failed = True
+                return
+            first_click, seed, mines, opening = future.result()
+            empty = np.flatnonzero(self.records['state'] == EMPTY)
+            if not empty.size:
+                return
+            record = self.records[empty[0]]
+            record['first_click'] = first_click
+            record['seed'] = seed
+            record['mines'] = mines
+            record['opening'] = opening
+            record['state'] = READY
+
+    def take(self, first_click):
+        """Return a ready board mirrored so that `first_click` is inside its opening, or `None` if no
+        stored board fits. The slot it came from is refilled in the background."""
+        level = self.level
+        size = level.height * level.width
+        row, col = divmod(first_click, level.width)
+        board = None
+        with self.lock:
+            for slot in np.flatnonzero(self.records['state'] == READY):
+                record = self.records[slot]
+                opening = np.unpackbits(record['opening'], count=size).reshape(level.height, level.width).astype(bool)
+                symmetry = next((k for k in symmetries(level.height, level.width) if mirror_cells(opening, k)[row, col]), None)
+                if symmetry is None:
+                    continue
+                board = Board(level)
+                board.set_mines(np.flatnonzero(np.unpackbits(record['mines'], count=size)))
+                board.seed = int(record['seed'])
+                board.first_click = board.placed_click = int(record['first_click'])
+                board.safe_area = True
+                board.mirror(symmetry)
+                record['state'] = EMPTY
+                break
+        self.refill()
+        return board
+
+    def close(self):
+        """Stop refilling and write the store to disk"""
+        with self.lock:
+            self.closed = True
+            self.records.flush()
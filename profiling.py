@@ -0,0 +1,169 @@
+"""
+    Title: Minesweeper Profiler
+    Description: Opt-in instrumentation that times callbacks into fixed-size histograms, counts
+                 widget and canvas operations, and measures how long each burst of events takes to
+                 reach the idle loop, where Tk repaints
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import json
+import tkinter as tk
+from collections import Counter, defaultdict
+from functools import wraps
+from time import perf_counter
+
+OCTAVES = 32  # powers of two of microseconds, up to about 35 minutes
+STEPS = 4  # buckets per octave
+PERCENTILES = (50, 95, 99)
+
+
+def bucket(microseconds):
+    """Return the histogram bucket of a duration: its octave and the next two bits below it"""
+    octave = microseconds.bit_length()
+    step = (microseconds >> (octave - 3)) & 3 if octave >= 3 else 0
+    return min(octave * STEPS + step, OCTAVES * STEPS - 1)
+
+
+def bucket_limit(index):
+    """Return the first duration in microseconds above a bucket"""
+    octave, step = divmod(index, STEPS)
+    if octave < 3:
+        return 1 << octave
+    return (1 << (octave - 3)) * (STEPS + step + 1)
+
+
+class Histogram:
+    """Durations counted in a fixed number of buckets, four to each power of two of microseconds"""
+    def __init__(self):
+        self.counts = [0] * (OCTAVES * STEPS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.counts[bucket(int(seconds * 1e6))] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent):
+        """Return the upper bound in milliseconds of the bucket holding a percentile"""
+        rank = self.count * percent / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return bucket_limit(index) / 1000
+        return 0.0
+
+    def summary(self):
+        summary = {'count': self.count, 'total_ms': self.total * 1000, 'max_ms': self.max * 1000}
+        summary.update({f'p{percent}_ms': self.percentile(percent) for percent in PERCENTILES})
+        summary['buckets_us'] = {bucket_limit(index): count for index, count in enumerate(self.counts) if count}
+        return summary
+
+
+class Profiler:
+    """Replaces methods on classes with timed or counted wrappers. Nothing is wrapped unless the
+    profiler is installed, so the game runs untouched without it."""
+    def __init__(self):
+        self.handlers = defaultdict(Histogram)
+        self.idle = Histogram()  # from the first callback of a burst to the idle loop
+        self.operations = Counter()
+        self.started = perf_counter()
+        self.root = None
+        self.depth = 0
+        self.waiting = None  # start of the oldest callback not yet followed by an idle loop
+        self.overlay = None
+
+    def time_calls(self, cls, names):
+        """Time every call to the named methods of a class"""
+        for name in names:
+            setattr(cls, name, self.timed(f"{cls.__name__}.{name}", getattr(cls, name)))
+
+    def count_calls(self, cls, names):
+        """Count every call to the named methods of a class"""
+        for name in names:
+            setattr(cls, name, self.counted(f"{cls.__name__}.{name}", getattr(cls, name)))
+
+    def timed(self, name, function):
+        histogram = self.handlers[name]
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            self.depth += 1
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.depth -= 1
+                histogram.add(perf_counter() - start)
+                if self.depth == 0 and self.root is not None and self.waiting is None:
+                    self.waiting = start
+                    self.root.after_idle(self.on_idle)
+        return wrapper
+
+    def counted(self, name, function):
+        operations = self.operations
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            operations[name] += 1
+            return function(*args, **kwargs)
+        return wrapper
+
+    def on_idle(self):
+        """The events before this have been handled and their redraws done"""
+        self.idle.add(perf_counter() - self.waiting)
+        self.waiting = None
+
+    def attach(self, root, overlay=True):
+        """Start measuring the time to idle on a root window and show the live overlay"""
+        self.root = root
+        if overlay:
+            self.overlay = ProfileOverlay(root, self)
+
+    def report(self):
+        """Return everything measured as a JSON-ready dict"""
+        return {
+            'duration_s': perf_counter() - self.started,
+            'event_to_idle': self.idle.summary(),
+            'handlers': {name: histogram.summary() for name, histogram in sorted(self.handlers.items()) if histogram.count},
+            'operations': dict(sorted(self.operations.items())),
+        }
+
+    def dump(self, filename):
+        with open(filename, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+
+
+class ProfileOverlay(tk.Toplevel):
+    """Small window with the slowest callbacks and the operation rates, refreshed twice a second"""
+    interval = 500
+
+    def __init__(self, root, profiler):
+        super().__init__(root)
+        self.profiler = profiler
+        self.title('Profile')
+        self.resizable(False, False)
+        self.attributes('-topmost', 'true')
+        self.geometry(f'+{root.winfo_x() + root.winfo_width() + 10}+{root.winfo_y()}')
+        self.text_var = tk.StringVar()
+        tk.Label(self, textvariable=self.text_var, font=('TkFixedFont', 9), justify=tk.LEFT, anchor=tk.NW).pack(padx=8, pady=8)
+        self.last_operations = Counter()
+        self.update_stats()
+
+    def update_stats(self):
+        profiler = self.profiler
+        idle = profiler.idle
+        lines = [f"{'event to idle':<30}{idle.count:>7} p50 {idle.percentile(50):>7.2f} p95 {idle.percentile(95):>7.2f} ms"]
+        slowest = sorted((histogram.percentile(95), name) for name, histogram in profiler.handlers.items() if histogram.count)
+        for p95, name in reversed(slowest[-8:]):
+            histogram = profiler.handlers[name]
+            lines.append(f"{name:<30}{histogram.count:>7} p50 {histogram.percentile(50):>7.2f} p95 {p95:>7.2f} ms")
+        rates = profiler.operations - self.last_operations
+        self.last_operations = Counter(profiler.operations)
+        for name, count in sorted(profiler.operations.items()):
+            lines.append(f"{name:<30}{count:>7} {rates[name] * 1000 / self.interval:>10.0f}/s")
+        self.text_var.set('\n'.join(lines))
+        self.after(self.interval, self.update_stats)
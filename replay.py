@@ -0,0 +1,187 @@
+"""
+    Title: Minesweeper Replays
+    Description: Records every input of a game as a packed event stream and verifies recorded games
+                 by playing them back without a display
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import struct
+from collections import namedtuple
+from glob import glob
+from os import path, remove
+from time import perf_counter
+import numpy as np
+from board import Board, MINE, REVEALED, FLAGGED
+
+MAGIC = b'MSREPLAY'
+VERSION = 3  # version 1 only opened a tile when released over the pressed tile; 3 adds resumed games
+HEADER = struct.Struct('<8sBBH')  # magic, version, flags, length of the board ID that follows
+MARKS_FLAG = 1
+RESUMED_FLAG = 2
+# after the board ID of a resumed game: seconds played, moves, clicks and the number of cell
+# states that follow, one byte per cell
+RESUMED = struct.Struct('<dIII')
+
+# one input: milliseconds since the previous one, the cell, and what was done
+EVENT = np.dtype([('delta', '<u2'), ('cell', '<u4'), ('action', 'u1')])
+EVENT_STRUCT = struct.Struct('<HIB')
+PRESS, RELEASE, FLAG, MARKS, WAIT, CHORD = range(6)
+NO_CELL = 0xFFFFFFFF  # a release outside the board
+MAX_DELTA = 0xFFFF  # longer pauses are written as a WAIT with the full delay in the cell field
+
+Event = namedtuple('Event', 'time cell action')
+Result = namedtuple('Result', 'won seconds moves')
+
+
+class ReplayRecorder:
+    """Writes a game's inputs to disk as they happen, so a replay is complete up to the last move
+    even if the game never ends. Times are kept relative to `start`, the game's start time. A
+    resumed game is recorded from the cell `state` it was resumed with, `seconds`, `moves` and
+    `clicks` into it."""
+    def __init__(self, filename, board_id, marks, start=None, state=None, seconds=0.0, moves=0, clicks=0):
+        self.filename = filename
+        self.start = perf_counter() if start is None else start
+        self.last = 0
+        board_id = board_id.encode('ascii')
+        flags = (MARKS_FLAG if marks else 0) | (RESUMED_FLAG if state is not None else 0)
+        self.file = open(filename, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, flags, len(board_id)) + board_id)
+        if state is not None:
+            self.file.write(RESUMED.pack(seconds, moves, clicks, state.size) + state.tobytes())
+        self.file.flush()
+
+    def record(self, action, cell):
+        """Append one input to the replay"""
+        now = round((perf_counter() - self.start) * 1000)
+        delta = max(0, now - self.last)
+        self.last += delta
+        if delta > MAX_DELTA:
+            self.file.write(EVENT_STRUCT.pack(0, delta, WAIT))
+            delta = 0
+        self.file.write(EVENT_STRUCT.pack(delta, NO_CELL if cell is None else cell, action))
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class Replay:
+    """A recorded game on disk. Events are read in chunks as they are iterated, so a replay of any
+    length is never loaded whole."""
+    def __init__(self, filename, chunk=4096):
+        self.filename = filename
+        self.chunk = chunk
+        with open(filename, 'rb') as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"Not a replay: {filename!r}")
+            magic, version, flags, length = HEADER.unpack(header)
+            if magic != MAGIC or not 1 <= version <= VERSION:
+                raise ValueError(f"Not a replay: {filename!r}")
+            self.board_id = f.read(length).decode('ascii')
+            self.offset = HEADER.size + length
+            # where a resumed game took over; a new game starts from nothing
+            self.state = None
+            self.seconds = 0.0
+            self.moves = self.clicks = 0
+            if flags & RESUMED_FLAG:
+                resumed = f.read(RESUMED.size)
+                if len(resumed) < RESUMED.size:
+                    raise ValueError(f"Not a replay: {filename!r}")
+                self.seconds, self.moves, self.clicks, cells = RESUMED.unpack(resumed)
+                self.state = np.frombuffer(f.read(cells), dtype=np.uint8)
+                if self.state.size != cells:
+                    raise ValueError(f"Not a replay: {filename!r}")
+                self.offset += RESUMED.size + cells
+        self.version = version
+        self.marks = bool(flags & MARKS_FLAG)
+
+    def board(self):
+        """Return the board the game was played on; a resumed game's cells are as they were when
+        it was resumed"""
+        board = Board.from_id(self.board_id)
+        if self.state is not None:
+            board = Board.from_state(self.board_id, board.first_click, self.state.copy())
+        return board
+
+    def __iter__(self):
+        """Yield every input as an `Event` with its time in milliseconds since the game started"""
+        time = 0
+        with open(self.filename, 'rb') as f:
+            f.seek(self.offset)
+            while True:
+                data = f.read(self.chunk * EVENT.itemsize)
+                # a partly written last event is ignored
+                events = np.frombuffer(data[:len(data) - len(data) % EVENT.itemsize], dtype=EVENT)
+                if not events.size:
+                    return
+                for delta, cell, action in zip(events['delta'].tolist(), events['cell'].tolist(), events['action'].tolist()):
+                    if action == WAIT:
+                        time += cell
+                        continue
+                    time += delta
+                    yield Event(time, None if cell == NO_CELL else cell, action)
+
+
+def prune(directory, keep):
+    """Delete all but the `keep` newest replays in a folder"""
+    filenames = sorted(glob(path.join(directory, '*.msr')), key=lambda filename: (path.getmtime(filename), filename))
+    for filename in filenames[:max(0, len(filenames) - keep)]:
+        remove(filename)
+
+
+def verify(filename):
+    """Play a replay on a headless board with the rules of the game and return whether it was won,
+    the time of the final move in seconds and the number of moves. An unfinished game has no time."""
+    replay = Replay(filename)
+    board = replay.board()
+    marks = replay.marks
+    pressed = None
+    moves = replay.moves
+    for time, cell, action in replay:
+        if action == PRESS:
+            pressed = cell
+            moves += 1
+        elif action in (RELEASE, CHORD):
+            press, pressed = pressed, None
+            if action == CHORD:
+                if cell is None or not moves:
+                    continue
+                moves += 1
+                cells = board.chord_cells(cell)
+            else:
+                if cell is None or press is None or board.has(cell, REVEALED | FLAGGED):
+                    continue
+                if replay.version < 2 and cell != press:
+                    continue
+                cells = [cell]
+            if board.has(cells, MINE).any():
+                return Result(False, time / 1000, moves)
+            board.reveal(cells)
+            if board.cleared:
+                return Result(True, time / 1000, moves)
+        elif action == FLAG:
+            board.cycle_mark(cell, marks)
+        elif action == MARKS:
+            marks = bool(cell)
+    return Result(False, None, moves)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Verify recorded games by playing them back headless")
+    parser.add_argument('replays', nargs='+', help="replay files")
+    args = parser.parse_args()
+    start = perf_counter()
+    for filename in args.replays:
+        replay = Replay(filename)
+        won, seconds, moves = verify(filename)
+        outcome = 'won' if won else 'lost' if seconds is not None else 'unfinished'
+        time = f"{seconds:.3f}s" if seconds is not None else '-'
+        print(f"{filename}: {replay.board_id} {outcome} in {time}, {moves} moves")
+    print(f"verified {len(args.replays)} replays in {perf_counter() - start:.3f}s")
+
+
+if __name__ == '__main__':
+    main()
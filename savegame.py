@@ -0,0 +1,53 @@
+"""
+    Title: Minesweeper Saved Games
+    Description: Saves a game in progress as one buffer, written and read back in a single call:
+                 a header with the timer and move count, the board ID, then one state byte per cell
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import struct
+from collections import namedtuple
+from os import path, replace
+import numpy as np
+from board import Board
+
+MAGIC = b'MSSAVEGM'
+VERSION = 2
+# magic, version, flags, moves, mirrored first click, seconds played, length of the board ID,
+# and from version 2 the clicks made
+HEADERS = {1: struct.Struct('<8sBBIIdH'), 2: struct.Struct('<8sBBIIdHI')}
+HEADER = HEADERS[VERSION]
+MARKS_FLAG = 1
+
+SavedGame = namedtuple('SavedGame', 'board seconds moves marks clicks')
+
+
+def save_game(filename, board, seconds, moves, marks, clicks):
+    """Write a game in progress. The file is replaced only once the new one is complete."""
+    board_id = board.board_id.encode('ascii')
+    offset = HEADER.size + len(board_id)
+    buffer = bytearray(offset + board.size)
+    HEADER.pack_into(buffer, 0, MAGIC, VERSION, MARKS_FLAG if marks else 0, moves, board.first_click, seconds, len(board_id), clicks)
+    buffer[HEADER.size:offset] = board_id
+    np.frombuffer(buffer, dtype=np.uint8, offset=offset)[:] = board.state.reshape(-1)
+    with open(filename + '.tmp', 'wb') as f:
+        f.write(buffer)
+    replace(filename + '.tmp', filename)
+
+
+def load_game(filename):
+    """Read a saved game back as a `SavedGame`. The board's cells are kept in the buffer read from
+    disk rather than copied out of it."""
+    buffer = bytearray(path.getsize(filename))
+    with open(filename, 'rb') as f:
+        f.readinto(buffer)
+    version = buffer[len(MAGIC)] if len(buffer) > len(MAGIC) else None
+    header = HEADERS.get(version)
+    if header is None or len(buffer) < header.size or buffer[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Not a saved game: {filename!r}")
+    magic, version, flags, moves, first_click, seconds, length, *clicks = header.unpack_from(buffer)
+    offset = header.size + length
+    state = np.frombuffer(buffer, dtype=np.uint8, offset=offset)
+    board = Board.from_state(buffer[header.size:offset].decode('ascii'), first_click, state)
+    # version 1 did not count the clicks; every move was at least one
+    return SavedGame(board, seconds, moves, bool(flags & MARKS_FLAG), clicks[0] if clicks else moves)
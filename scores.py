@@ -0,0 +1,177 @@
+"""
+    Title: Minesweeper Scores
+    Description: Records every finished game, with the 3BV of its board and the clicks it took, in
+                 an indexed SQLite store and answers leaderboard queries by level, player and date
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import pickle
+import sqlite3
+from collections import namedtuple
+from datetime import datetime
+from os import path, replace
+from board import DEFINED_LEVELS
+
+Score = namedtuple('Score', 'id level won seconds name played board_id bv openings clicks')
+
+# version of the schema below, kept in the database's user_version
+SCHEMA_VERSION = 2
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    level TEXT NOT NULL,
+    won INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    name TEXT NOT NULL,
+    played TEXT NOT NULL,
+    board_id TEXT,
+    bv INTEGER,
+    openings INTEGER,
+    clicks INTEGER
+);
+CREATE INDEX IF NOT EXISTS games_leaderboard ON games (level, seconds) WHERE won = 1;
+CREATE INDEX IF NOT EXISTS games_name ON games (name, played);
+CREATE INDEX IF NOT EXISTS games_played ON games (played);
+"""
+# statements that bring a database from the version of their index to the next one
+MIGRATIONS = [
+    [],
+    ["ALTER TABLE games ADD COLUMN bv INTEGER",
+     "ALTER TABLE games ADD COLUMN openings INTEGER",
+     "ALTER TABLE games ADD COLUMN clicks INTEGER"],
+]
+COLUMNS = ', '.join(Score._fields)
+TOP_N = 10
+
+# the placeholder time of an empty slot in the old pickle
+LEGACY_EMPTY = 999
+LegacyScore = namedtuple('LegacyScore', 'score name')
+
+
+def timestamp(when=None):
+    """Return a sortable local date and time for the `played` column"""
+    return (when or datetime.now()).isoformat(' ', 'seconds')
+
+
+class LegacyUnpickler(pickle.Unpickler):
+    """Reads the old `highscores.data` pickle; nothing but its score tuples may be loaded"""
+    def find_class(self, module, name):
+        if name == 'Score':
+            return LegacyScore
+        raise pickle.UnpicklingError(f"Unexpected object in high scores: {module}.{name}")
+
+
+class ScoreStore:
+    """Every finished game, won or lost, is one row. Leaderboards are read from a partial index of
+    won games by level and time, so opening the store and showing the top times never scans the
+    table. Each write is its own transaction in write-ahead-log mode, so a crash can lose at most
+    the game being written and never leaves the file half updated."""
+    def __init__(self, filename='highscores.db', legacy='highscores.data'):
+        self.filename = filename
+        try:
+            self.conn = self.connect(legacy)
+        except sqlite3.OperationalError:
+            raise
+        except sqlite3.DatabaseError:
+            # unreadable database; keep it aside for inspection and start a new one
+            replace(filename, filename + '.corrupt')
+            self.conn = self.connect(legacy)
+
+    def connect(self, legacy):
+        """Open the database, creating the schema and importing the old pickle on first use"""
+        conn = sqlite3.connect(self.filename)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=FULL')
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if version < SCHEMA_VERSION:
+                # one transaction, so an interrupted upgrade is simply run again
+                with conn:
+                    conn.execute('BEGIN')
+                    if version == 0:
+                        for statement in SCHEMA.split(';'):
+                            conn.execute(statement)
+                        conn.executemany("INSERT INTO games (level, won, seconds, name, played) VALUES (?, 1, ?, ?, ?)", self.read_legacy(legacy))
+                    else:
+                        for statements in MIGRATIONS[version:]:
+                            for statement in statements:
+                                conn.execute(statement)
+                    conn.execute(f'PRAGMA user_version={SCHEMA_VERSION}')
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return conn
+
+    @staticmethod
+    def read_legacy(filename):
+        """Return (level, seconds, name, played) rows for the real times in the old pickle. A
+        missing or corrupt file has nothing to import."""
+        if not path.exists(filename):
+            return []
+        try:
+            with open(filename, 'rb') as f:
+                highscores = LegacyUnpickler(f).load()
+            played = timestamp(datetime.fromtimestamp(path.getmtime(filename)))
+            return [(level, float(score.score), str(score.name), played) for level, score in highscores.items()
+                    if level in DEFINED_LEVELS and score.score < LEGACY_EMPTY]
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, TypeError, ValueError):
+            return []
+
+    def query(self, sql, params=()):
+        """Return the rows of a query as scores"""
+        return [Score(*row) for row in self.conn.execute(sql, params)]
+
+    def record(self, level, won, seconds, name='Anonymous', board_id=None, bv=None, openings=None, clicks=None):
+        """Record a finished game and return its id"""
+        with self.conn:
+            cursor = self.conn.execute("INSERT INTO games (level, won, seconds, name, played, board_id, bv, openings, clicks) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                       (level, int(won), seconds, name, timestamp(), board_id, bv, openings, clicks))
+        return cursor.lastrowid
+
+    def rename(self, game_id, name):
+        """Set the player name of a recorded game"""
+        with self.conn:
+            self.conn.execute("UPDATE games SET name = ? WHERE id = ?", (name, game_id))
+
+    def top(self, level, n=TOP_N):
+        """Return the n fastest wins of a level"""
+        return self.query(f"SELECT {COLUMNS} FROM games WHERE won = 1 AND level = ? ORDER BY seconds, id LIMIT ?", (level, n))
+
+    def best(self, level):
+        """Return the fastest win of a level, or `None` if it has never been won"""
+        top = self.top(level, 1)
+        return top[0] if top else None
+
+    def rank(self, game_id):
+        """Return the leaderboard position of a won game, starting at 1"""
+        level, seconds = self.conn.execute("SELECT level, seconds FROM games WHERE id = ?", (game_id,)).fetchone()
+        faster = self.conn.execute("SELECT COUNT(*) FROM games WHERE won = 1 AND level = ? AND (seconds < ? OR seconds = ? AND id < ?)",
+                                   (level, seconds, seconds, game_id)).fetchone()[0]
+        return faster + 1
+
+    def levels(self):
+        """Return the keys of every level with at least one win, defined levels first"""
+        keys = [row[0] for row in self.conn.execute("SELECT DISTINCT level FROM games WHERE won = 1")]
+        return [key for key in DEFINED_LEVELS if key in keys] + sorted(key for key in keys if key not in DEFINED_LEVELS)
+
+    def by_player(self, name, limit=100):
+        """Return the most recent games of a player"""
+        return self.query(f"SELECT {COLUMNS} FROM games WHERE name = ? ORDER BY played DESC LIMIT ?", (name, limit))
+
+    def between(self, start, end, level=None):
+        """Return the games played from `start` up to `end`, both datetimes, in the order played"""
+        sql = f"SELECT {COLUMNS} FROM games WHERE played >= ? AND played < ?"
+        params = [timestamp(start), timestamp(end)]
+        if level is not None:
+            sql += " AND level = ?"
+            params.append(level)
+        return self.query(sql + " ORDER BY played", params)
+
+    def reset(self):
+        """Delete every recorded game"""
+        with self.conn:
+            self.conn.execute("DELETE FROM games")
+
+    def close(self):
+        """Checkpoint the write-ahead log and close the database"""
+        self.conn.close()
@@ -0,0 +1,398 @@
+"""
+    Title: Minesweeper Automation Server
+    Description: A local socket that bots and test harnesses use to play. Each line sent is a JSON
+                 command, or a list of them, and each is answered with one line listing the cells
+                 it changed. Run it without a display, with a headless game per connection:
+                     python server.py [localhost:8765 | unix:/path/to/socket]
+                 or drive the game on screen with `python minesweeper.py --serve`.
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import json
+import selectors
+import socket
+from os import path, remove
+import numpy as np
+from board import Board, Level, DEFINED_LEVELS, MAX_SIDE, level_name, MINE, REVEALED, FLAGGED, QUESTIONED, MARKED, COUNT_SHIFT
+
+DEFAULT_ADDRESS = 'localhost:8765'
+CHUNK = 65536
+POLL_MS = 20  # how often the socket is checked where Tk cannot watch it directly
+
+# how a cell is shown in `values`: covered, flag, question mark, a mine on a lost board and the
+# mine that lost it; a revealed cell is its count, '0' to '8'
+COVERED, FLAG, QUESTION, MINE_SHOWN, EXPLODED = b'.F?*X'
+
+
+def read_level(level):
+    """Return a level given by name or as [height, width, mines]"""
+    if isinstance(level, str):
+        if level not in DEFINED_LEVELS:
+            raise ValueError(f"Unknown level: {level!r}")
+        return DEFINED_LEVELS[level]
+    height, width, mines = (int(n) for n in level)
+    if not (0 < height <= MAX_SIDE and 0 < width <= MAX_SIDE and 0 < mines < height * width):
+        raise ValueError(f"Invalid level: {level!r}")
+    return Level(height, width, mines)
+
+
+def read_seed(seed):
+    """Return the seed of a command, checked to be one the mines can be placed with"""
+    if seed is None:
+        return None
+    seed = int(seed)
+    if seed < 0:
+        raise ValueError(f"Invalid seed: {seed}")
+    return seed
+
+
+class Session:
+    """A game played on a headless `Board` with the same rules as the game on screen: the mines are
+    placed by the first reveal, a reveal stops at the first mine and a chord opens the covered
+    neighbors of a number with as many flags around it"""
+    def __init__(self):
+        self.board = Board(DEFINED_LEVELS['beginner'])
+        self.seed = None  # of the next board's mines; random if not given
+        self.marks = False
+        self.moves = 0
+        self.exploded = None
+        self.won = False
+
+    def status(self):
+        if self.exploded is not None:
+            return 'lost'
+        if self.won:
+            return 'won'
+        return 'playing' if self.board.seed is not None else 'ready'
+
+    def new(self, level='beginner', seed=None, board_id=None, marks=False):
+        """Start a game, on the board of a board ID if given with its first click already made.
+        Everything is checked before the game in progress is given up."""
+        if board_id is not None:
+            board = Board.from_id(board_id)
+        else:
+            seed = read_seed(seed)
+            board = Board(read_level(level))
+        self.board = board
+        self.marks = bool(marks)
+        self.moves = 0
+        self.exploded = None
+        self.won = False
+        if board_id is not None:
+            self.moves = 1
+            self.open([board.first_click])
+            return
+        self.seed = seed
+
+    def reveal(self, cells):
+        for cell in cells:
+            if self.status() in ('won', 'lost'):
+                return
+            if self.board.seed is None:
+                self.board.place_mines(cell, self.seed)
+            self.moves += 1
+            if not self.board.has(cell, REVEALED | FLAGGED):
+                self.open([cell])
+
+    def flag(self, cells):
+        """Right-click each cell: flag it, then question mark it if marks are on, then clear it"""
+        for cell in cells:
+            if self.status() not in ('won', 'lost'):
+                self.board.cycle_mark(cell, self.marks)
+
+    def chord(self, cell):
+        if self.status() != 'playing':
+            return
+        self.moves += 1
+        cells = self.board.chord_cells(cell)
+        if cells.size:
+            self.open(cells)
+
+    def open(self, cells):
+        """Open covered cells in one batch, losing on a mine"""
+        board = self.board
+        cells = np.asarray(cells).reshape(-1)
+        mines = cells[board.has(cells, MINE)]
+        if mines.size:
+            self.exploded = int(mines[0])
+            return
+        board.reveal(cells)
+        self.won = board.cleared
+
+
+class GameSession:
+    """Plays the game on screen through its own input handlers, so every command looks to the
+    game like the player's clicks and is drawn, timed, recorded and scored the same way. All the
+    connections share the one game."""
+    def __init__(self, game):
+        self.game = game
+
+    @property
+    def board(self):
+        return self.game.board
+
+    @property
+    def moves(self):
+        return self.game.move_count
+
+    @property
+    def exploded(self):
+        return self.game.exploded
+
+    def status(self):
+        game = self.game
+        if game.game_over:
+            return 'lost' if game.exploded is not None else 'won'
+        return 'playing' if game.move_count else 'ready'
+
+    def new(self, level='beginner', seed=None, board_id=None, marks=None):
+        game = self.game
+        if board_id is None:
+            level, seed = read_level(level), read_seed(seed)
+        if marks is not None:
+            game.use_marks = bool(marks)
+            game.marks_var.set(int(game.use_marks))
+        if board_id is not None:
+            game.play_board(board_id)
+            return
+        game.set_level(level_name(level), level)
+        game.next_seed = seed
+
+    def reveal(self, cells):
+        for cell in cells:
+            self.game.on_lclick_tile(cell)
+            self.game.on_lclick_tile_release(cell)
+
+    def flag(self, cells):
+        for cell in cells:
+            self.game.on_rclick_tile(cell)
+
+    def chord(self, cell):
+        self.game.on_chord_press(cell)
+        self.game.on_chord_release(cell)
+
+
+def view(session, cells):
+    """Return how each of the cells is shown as a string with one character per cell"""
+    state = session.board.state.reshape(-1)[cells]
+    values = np.full(cells.size, COVERED, dtype=np.uint8)
+    values[(state & QUESTIONED) != 0] = QUESTION
+    values[(state & FLAGGED) != 0] = FLAG
+    status = session.status()
+    if status == 'lost':
+        values[(state & MINE) != 0] = MINE_SHOWN
+        values[cells == session.exploded] = EXPLODED
+    elif status == 'won':
+        values[(state & MINE) != 0] = FLAG
+    revealed = (state & REVEALED) != 0
+    values[revealed] = ord('0') + (state[revealed] >> COUNT_SHIFT)
+    return values.tobytes().decode('ascii')
+
+
+def read_cells(board, cells):
+    """Return the cells of a command as a list, checked to be on the board"""
+    cells = [int(cell) for cell in ([cells] if isinstance(cells, int) else cells)]
+    for cell in cells:
+        if not 0 <= cell < board.size:
+            raise ValueError(f"Cell {cell} is not on the {board.height}x{board.width} board")
+    return cells
+
+
+def handle(session, command):
+    """Run one command and return its reply. Every reply but a query's lists the cells the command
+    changed, with their new `values`; a query lists every cell. A new board brings all of its
+    uncovered cells and the end of a game adds the mines."""
+    try:
+        name = command['cmd']
+        board = session.board
+        before = board.state & (REVEALED | MARKED)
+        status = session.status()
+        if name == 'query':
+            changed = np.arange(board.size)
+        else:
+            if name == 'new':
+                session.new(command.get('level', 'beginner'), command.get('seed'), command.get('board_id'), command.get('marks'))
+            elif name == 'reveal':
+                session.reveal(read_cells(board, command['cells']))
+            elif name == 'flag':
+                session.flag(read_cells(board, command['cells']))
+            elif name == 'chord':
+                session.chord(read_cells(board, command['cell'])[0])
+            else:
+                raise ValueError(f"Unknown command: {name!r}")
+            if session.board is not board or session.board.state.shape != before.shape:
+                changed = np.flatnonzero(session.board.state & (REVEALED | MARKED))
+            else:
+                # placing the mines changes every cell's count, but only these bits are shown
+                changed = np.flatnonzero((session.board.state & (REVEALED | MARKED)) != before)
+            if session.status() != status and session.status() in ('won', 'lost'):
+                changed = np.union1d(changed, session.board.mine_indices())
+    except (KeyError, IndexError, TypeError, ValueError, ArithmeticError) as error:
+        # ArithmeticError covers numbers too large for an int, such as 1e400
+        return {'ok': False, 'error': str(error)}
+    board = session.board
+    reply = {'ok': True, 'status': session.status(), 'moves': session.moves}
+    if name in ('new', 'query'):
+        reply.update(height=board.height, width=board.width, mines=board.level.mines, board_id=board.board_id)
+    reply.update(cells=changed.tolist(), values=view(session, changed))
+    return reply
+
+
+def parse_address(address):
+    """Return the socket family and address of `host:port` or `unix:path`"""
+    if address.startswith('unix:'):
+        return socket.AF_UNIX, address[5:]
+    host, _, port = address.rpartition(':')
+    return socket.AF_INET, (host or 'localhost', int(port))
+
+
+class Server:
+    """Listens on a local TCP port or Unix socket and answers the commands of any number of
+    connections. Nothing ever blocks: `poll` handles whatever is ready and returns, so the server
+    runs inside the Tk event loop as well as on its own."""
+    def __init__(self, address=DEFAULT_ADDRESS, session=Session):
+        self.session = session  # called for the session of each new connection
+        self.family, self.address = parse_address(address)
+        if self.family == socket.AF_UNIX and path.exists(self.address):
+            remove(self.address)
+        self.listener = socket.socket(self.family, socket.SOCK_STREAM)
+        if self.family == socket.AF_INET:
+            self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(self.address)
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        self.root = None
+        self.job = None
+
+    def poll(self, timeout=0):
+        """Accept, read and answer whatever is ready, waiting at most `timeout` seconds for it"""
+        for key, events in self.selector.select(timeout):
+            if key.fileobj is self.listener:
+                self.accept()
+            elif events & selectors.EVENT_READ:
+                self.read(key)
+            elif events & selectors.EVENT_WRITE:
+                self.write(key)
+
+    def serve_forever(self):
+        while True:
+            self.poll(None)
+
+    def accept(self):
+        try:
+            conn, _ = self.listener.accept()
+        except BlockingIOError:
+            return
+        conn.setblocking(False)
+        if self.family == socket.AF_INET:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.selector.register(conn, selectors.EVENT_READ, Connection(self.session()))
+
+    def read(self, key):
+        """Answer every complete line received; a partial line waits for the rest"""
+        conn, connection = key.fileobj, key.data
+        try:
+            data = conn.recv(CHUNK)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b''
+        if not data:
+            self.drop(conn)
+            return
+        connection.inbox += data
+        *lines, connection.inbox = connection.inbox.split(b'\n')
+        for line in lines:
+            if line.strip():
+                connection.outbox += connection.answer(line)
+        self.write(key)
+
+    def write(self, key):
+        """Send as much of the pending replies as the socket takes, and wait to send the rest"""
+        conn, connection = key.fileobj, key.data
+        try:
+            sent = conn.send(connection.outbox)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self.drop(conn)
+            return
+        del connection.outbox[:sent]
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if connection.outbox else 0)
+        if events != key.events:
+            self.selector.modify(conn, events, connection)
+
+    def drop(self, conn):
+        self.selector.unregister(conn)
+        conn.close()
+
+    def attach(self, root):
+        """Serve from a Tk event loop. Where Tk can watch the selector it is woken only when a
+        socket is ready; elsewhere the sockets are polled with `after`."""
+        self.root = root
+        fileno = getattr(self.selector, 'fileno', None)
+        if fileno is not None and hasattr(root.tk, 'createfilehandler'):
+            root.tk.createfilehandler(fileno(), 1, lambda *_: self.poll())  # 1 is tkinter.READABLE
+        else:
+            self.poll_later()
+
+    def poll_later(self):
+        self.poll()
+        self.job = self.root.after(POLL_MS, self.poll_later)
+
+    def close(self):
+        if self.root is not None:
+            fileno = getattr(self.selector, 'fileno', None)
+            if self.job is not None:
+                self.root.after_cancel(self.job)
+            elif fileno is not None:
+                self.root.tk.deletefilehandler(fileno())
+        for key in list(self.selector.get_map().values()):
+            key.fileobj.close()
+        self.selector.close()
+        if self.family == socket.AF_UNIX and path.exists(self.address):
+            remove(self.address)
+
+
+class Connection:
+    """The session of one connection and the bytes waiting to be parsed and sent"""
+    def __init__(self, session):
+        self.session = session
+        self.inbox = bytearray()
+        self.outbox = bytearray()
+
+    def answer(self, line):
+        """Return the reply line to a command, or to a list of commands run in order"""
+        try:
+            request = json.loads(line)
+        except (ValueError, RecursionError) as error:
+            # a RecursionError is raised by arrays or objects nested too deeply
+            reply = {'ok': False, 'error': f"Invalid JSON: {error}"}
+        else:
+            if isinstance(request, list):
+                reply = [handle(self.session, command) for command in request]
+            else:
+                reply = handle(self.session, request)
+        return json.dumps(reply, separators=(',', ':')).encode() + b'\n'
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve headless Minesweeper games to bots over a local socket")
+    parser.add_argument('address', nargs='?', default=DEFAULT_ADDRESS, help="host:port or unix:path (default %(default)s)")
+    args = parser.parse_args()
+    server = Server(args.address)
+    print(f"serving on {args.address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
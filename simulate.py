@@ -0,0 +1,133 @@
+"""
+    Title: Minesweeper Simulator
+    Description: Headless Monte Carlo statistics over large batches of boards; every step works on
+                 an (N, height, width) stack of boards at once
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import argparse
+import json
+from time import perf_counter
+import numpy as np
+from board import Board, DEFINED_LEVELS, OFFSETS, neighbor_counts
+from metrics import three_bv
+from solver import solve
+
+
+def generate_batch(level, n, rng, first_click=None, safe_area=False):
+    """Return an (n, height, width) boolean stack of mine layouts drawn without replacement. The
+    first click, and with `safe_area` its 3x3 area, is kept clear on every board."""
+    size = level.height * level.width
+    keys = rng.random((n, size), dtype=np.float32)
+    if first_click is not None:
+        # keys above 1 are never among the smallest, so these cells never get a mine
+        keys[:, first_click] = 2.0
+        if safe_area:
+            keys[:, Board(level).neighbors(first_click)] = 2.0
+    picks = np.argpartition(keys, level.mines - 1, axis=1)[:, :level.mines]
+    mines = np.zeros((n, size), dtype=bool)
+    np.put_along_axis(mines, picks, True, axis=1)
+    return mines.reshape(n, level.height, level.width)
+
+
+def dilate(cells):
+    """Grow a stack of boolean boards by one cell in all 8 directions"""
+    height, width = cells.shape[-2:]
+    padded = np.pad(cells, [(0, 0), (1, 1), (1, 1)])
+    grown = cells.copy()
+    for dr, dc in OFFSETS:
+        grown |= padded[:, 1 + dr:1 + dr + height, 1 + dc:1 + dc + width]
+    return grown
+
+
+def reveal_batch(mines, counts, first_click):
+    """Return the cells revealed by clicking `first_click` on every board of a stack. The flood
+    advances one ring per step on all boards together until no board has an open zero frontier."""
+    n, height, width = mines.shape
+    zero = (counts == 0) & ~mines
+    revealed = np.zeros(mines.shape, dtype=bool)
+    row, col = divmod(first_click, width)
+    revealed[:, row, col] = ~mines[:, row, col]
+    frontier = revealed & zero
+    while frontier.any():
+        new = dilate(frontier) & ~revealed & ~mines
+        revealed |= new
+        frontier = new & zero
+    return revealed
+
+
+def simulate(level, n, seed=None, first_click=None, safe_area=False, batch_size=10000, solver_sample=0):
+    """Generate n boards of a level in batches and return statistics and throughput as a dict"""
+    rng = np.random.default_rng(seed)
+    if first_click is None:
+        first_click = (level.height // 2) * level.width + level.width // 2
+    opening_sizes = []
+    bvs = []
+    number_cells = np.zeros(9, dtype=np.int64)
+    generate_time = reveal_time = bv_time = 0.0
+    done = 0
+    while done < n:
+        batch = min(batch_size, n - done)
+        start = perf_counter()
+        mines = generate_batch(level, batch, rng, first_click, safe_area)
+        counts = neighbor_counts(mines)
+        generate_time += perf_counter() - start
+        start = perf_counter()
+        revealed = reveal_batch(mines, counts, first_click)
+        reveal_time += perf_counter() - start
+        opening_sizes.append(revealed.sum(axis=(1, 2)))
+        start = perf_counter()
+        bvs.append(three_bv(mines, counts)[0])
+        bv_time += perf_counter() - start
+        number_cells += np.bincount(counts[~mines], minlength=9)
+        done += batch
+    opening_sizes = np.concatenate(opening_sizes)
+    bvs = np.concatenate(bvs)
+
+    # the solver plays one board at a time, so it only runs on a sample of the boards
+    wins = 0
+    solver_time = 0.0
+    if solver_sample:
+        start = perf_counter()
+        for _ in range(solver_sample):
+            board = Board(level)
+            board.place_mines(first_click, int(rng.integers(2 ** 32)), safe_area)
+            wins += solve(board)
+        solver_time = perf_counter() - start
+
+    return {
+        'level': level._asdict(),
+        'boards': n,
+        'first_click': first_click,
+        'safe_area': safe_area,
+        'opening_size_mean': float(opening_sizes.mean()),
+        'opening_size_percentiles': {p: float(v) for p, v in zip((5, 25, 50, 75, 95), np.percentile(opening_sizes, (5, 25, 50, 75, 95)))},
+        'first_click_zero_rate': float((opening_sizes > 1).mean()),
+        'number_cells': {str(count): int(total) for count, total in enumerate(number_cells)},
+        'bv_mean': float(bvs.mean()),
+        'bv_percentiles': {p: float(v) for p, v in zip((5, 25, 50, 75, 95), np.percentile(bvs, (5, 25, 50, 75, 95)))},
+        'solver_games': solver_sample,
+        'solver_win_rate': wins / solver_sample if solver_sample else None,
+        'boards_per_sec': n / generate_time if generate_time else None,
+        'reveals_per_sec': n / reveal_time if reveal_time else None,
+        'bv_per_sec': n / bv_time if bv_time else None,
+        'games_per_sec': solver_sample / solver_time if solver_time else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo statistics over batches of boards")
+    parser.add_argument('level', choices=list(DEFINED_LEVELS), help="level to simulate")
+    parser.add_argument('-n', '--boards', type=int, default=100000, help="number of boards")
+    parser.add_argument('--seed', type=int, default=None, help="seed for reproducible runs")
+    parser.add_argument('--safe-area', action='store_true', help="keep the 3x3 area of the first click clear")
+    parser.add_argument('--batch-size', type=int, default=10000, help="boards generated per batch")
+    parser.add_argument('--solver-sample', type=int, default=0, help="boards to play with the solver")
+    args = parser.parse_args()
+    stats = simulate(DEFINED_LEVELS[args.level], args.boards, args.seed, safe_area=args.safe_area,
+                     batch_size=args.batch_size, solver_sample=args.solver_sample)
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == '__main__':
+    main()
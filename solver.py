@@ -0,0 +1,230 @@
+"""
+    Title: Minesweeper Solver
+    Description: Deduces safe tiles and mines from the revealed numbers on a board; used for hints
+                 and to generate boards that can be cleared without guessing
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import numpy as np
+from board import Board
+
+# largest frontier component enumerated when the local rules get stuck, and the search budget
+MAX_COMPONENT = 24
+MAX_NODES = 100000
+
+
+class OutOfBudget(Exception):
+    """Raised when an exhaustive search visits more than its budget of nodes"""
+
+
+class Solver:
+    """Works on the frontier of a board: every revealed number that still has covered neighbors is
+    a constraint saying how many mines are left among those neighbors. Deductions are tried from the
+    cheapest to the most expensive; single constraints, then pairs of overlapping constraints, then a
+    bounded exhaustive search of each connected component of the frontier. Only revealed numbers
+    are used, never the player's flags."""
+    def __init__(self, board, max_component=MAX_COMPONENT, max_nodes=MAX_NODES):
+        self.board = board
+        self.max_component = max_component
+        self.max_nodes = max_nodes
+        self.mines = set()  # covered cells proven to be mines
+
+    def constraints(self):
+        """Return the frontier constraints as a dict of {frozenset(unknown cells): mines left}"""
+        board = self.board
+        revealed = board.revealed.reshape(-1)
+        counts = board.counts.reshape(-1)
+        numbers = np.flatnonzero(revealed & (counts > 0))
+        neighbors = board.neighbor_rows(numbers)
+        covered = (neighbors >= 0) & ~revealed[neighbors]
+        on_frontier = covered.any(axis=1)
+        constraints = {}
+        mines = self.mines
+        for count, row, mask in zip(counts[numbers[on_frontier]].tolist(), neighbors[on_frontier].tolist(), covered[on_frontier].tolist()):
+            cells = [cell for cell, is_covered in zip(row, mask) if is_covered]
+            unknown = frozenset(cell for cell in cells if cell not in mines)
+            if unknown:
+                constraints[unknown] = count - (len(cells) - len(unknown))
+        return constraints
+
+    def deduce(self):
+        """Return a pair of sets (safe, mines) of covered cells that follow from the revealed
+        numbers. Both are empty when the position cannot be advanced without guessing."""
+        constraints = self.constraints()
+        for rule in (self.single_rule, self.pair_rule, self.enumerate_rule):
+            safe, mines = rule(constraints)
+            if safe or mines:
+                self.mines |= mines
+                return safe, mines
+        return self.count_rule()
+
+    @staticmethod
+    def single_rule(constraints):
+        """A constraint with no mines left is all safe; one with a mine per cell is all mines"""
+        safe, mines = set(), set()
+        for cells, left in constraints.items():
+            if left == 0:
+                safe |= cells
+            elif left == len(cells):
+                mines |= cells
+        return safe, mines
+
+    @staticmethod
+    def pair_rule(constraints):
+        """For overlapping constraints A and B the overlap holds at least left(A) - |A - B| mines.
+        When that equals left(B), every cell of A - B is a mine and every cell of B - A is safe.
+        This also covers the subset rule, where A is contained in B."""
+        by_cell = {}
+        for cells in constraints:
+            for cell in cells:
+                by_cell.setdefault(cell, []).append(cells)
+        safe, mines = set(), set()
+        for a, left_a in constraints.items():
+            for b in {b for cell in a for b in by_cell[cell]}:
+                if a is b:
+                    continue
+                only_a = a - b
+                if left_a - len(only_a) == constraints[b]:
+                    mines |= only_a
+                    safe |= b - a
+        return safe, mines
+
+    def enumerate_rule(self, constraints):
+        """Enumerate every mine layout of each small frontier component; a cell that is a mine in
+        none of the layouts is safe and one that is a mine in all of them is a mine"""
+        safe, mines = set(), set()
+        for component in self.components(constraints):
+            cells = sorted({cell for cells in component for cell in cells})
+            if len(cells) > self.max_component:
+                continue
+            result = self.search(cells, component)
+            if result is None:
+                continue
+            solutions, hits = result
+            for cell, hit in zip(cells, hits):
+                if hit == 0:
+                    safe.add(cell)
+                elif hit == solutions:
+                    mines.add(cell)
+        return safe, mines
+
+    @staticmethod
+    def components(constraints):
+        """Split the constraints into groups that share no cells"""
+        parent = {}
+
+        def find(cell):
+            while parent.setdefault(cell, cell) != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            return cell
+
+        for cells in constraints:
+            first, *rest = cells
+            for cell in rest:
+                parent[find(cell)] = find(first)
+        groups = {}
+        for cells, left in constraints.items():
+            groups.setdefault(find(next(iter(cells))), {})[cells] = left
+        return list(groups.values())
+
+    def search(self, cells, constraints):
+        """Backtracking search over the mine layouts of one component. Returns the number of layouts
+        and, per cell, the number of layouts with a mine there; `None` if the budget runs out."""
+        position = {cell: i for i, cell in enumerate(cells)}
+        left = list(constraints.values())
+        cell_constraints = [[] for _ in cells]
+        for c, group in enumerate(constraints):
+            for cell in group:
+                cell_constraints[position[cell]].append(c)
+        placed = [0] * len(left)  # mines assigned per constraint
+        open_cells = [len(group) for group in constraints]  # cells not yet assigned per constraint
+        assignment = [0] * len(cells)
+        hits = [0] * len(cells)
+        solutions = 0
+        nodes = 0
+
+        def place(i):
+            nonlocal solutions, nodes
+            if i == len(cells):
+                solutions += 1
+                for j, mine in enumerate(assignment):
+                    hits[j] += mine
+                return
+            nodes += 1
+            if nodes > self.max_nodes:
+                raise OutOfBudget
+            linked = cell_constraints[i]
+            for c in linked:
+                open_cells[c] -= 1
+            for value in (0, 1):
+                if all(placed[c] + value <= left[c] <= placed[c] + value + open_cells[c] for c in linked):
+                    for c in linked:
+                        placed[c] += value
+                    assignment[i] = value
+                    place(i + 1)
+                    for c in linked:
+                        placed[c] -= value
+            assignment[i] = 0
+            for c in linked:
+                open_cells[c] += 1
+
+        try:
+            place(0)
+        except OutOfBudget:
+            return None
+        return solutions, hits
+
+    def count_rule(self):
+        """Use the number of mines left on the board when nothing else applies"""
+        board = self.board
+        covered = set(np.flatnonzero(~board.revealed.reshape(-1)).tolist()) - self.mines
+        left = board.level.mines - len(self.mines)
+        if covered and left == 0:
+            return covered, set()
+        if covered and left == len(covered):
+            self.mines |= covered
+            return set(), covered
+        return set(), set()
+
+
+def hint(board):
+    """Return a covered cell that is certainly safe, or `None` if the player has to guess. A pass
+    that only proves mines is followed by another, which can use them, as `solve` does."""
+    solver = Solver(board)
+    while True:
+        known = len(solver.mines)
+        safe, mines = solver.deduce()
+        if safe:
+            return min(safe)
+        if not mines or len(solver.mines) == known:
+            return None
+
+
+def solve(board, first_click=None):
+    """Play the board from its first click using deductions only. The board is played in place;
+    returns True if every safe cell was revealed without a guess."""
+    board.reveal(board.first_click if first_click is None else first_click)
+    solver = Solver(board)
+    target = board.size - int(board.mines.sum())
+    while board.revealed_count < target:
+        safe, mines = solver.deduce()
+        if not safe and not mines:
+            return False
+        if safe:
+            board.reveal(list(safe))
+    return True
+
+
+def generate_no_guess(level, first_click, seed=None, attempts=10000):
+    """Return a board for the level that can be cleared from `first_click` without guessing.
+    Candidate boards keep the 3x3 area around the first click clear and are checked with the
+    solver until one can be cleared. The board seeds are drawn from `seed`, so the same seed
+    always yields the same board."""
+    rng = np.random.default_rng(seed)
+    for _ in range(attempts):
+        board = Board(level)
+        board.place_mines(first_click, int(rng.integers(2 ** 32)), safe_area=True)
+        if solve(board.copy()):
+            return board
+    raise RuntimeError(f"No board without guessing found in {attempts} attempts")
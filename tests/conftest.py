@@ -0,0 +1,5 @@
+import sys
+from os import path
+
+# the modules live at the top of the repository, next to minesweeper.py
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
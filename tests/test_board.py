@@ -0,0 +1,165 @@
+"""
+    Title: Board Tests
+    Description: Checks the headless board engine against slow, obvious implementations
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+from collections import deque
+import numpy as np
+import pytest
+from board import Board, Level, DEFINED_LEVELS, level_key, level_name, neighbor_counts, parse_id, MINE, REVEALED, FLAGGED, QUESTIONED, TABLE_CELLS
+
+
+def brute_counts(mines):
+    height, width = mines.shape
+    counts = np.zeros(mines.shape, dtype=int)
+    for row in range(height):
+        for col in range(width):
+            counts[row, col] = sum(mines[r, c] for r in range(row - 1, row + 2) for c in range(col - 1, col + 2)
+                                   if (r, c) != (row, col) and 0 <= r < height and 0 <= c < width)
+    return counts
+
+
+def brute_reveal(board, index):
+    """Flood fill a copy of the board one cell at a time and return the set of cells opened"""
+    mines, counts, flagged = board.mines, board.counts, board.flagged
+    opened, todo = set(), deque([index])
+    while todo:
+        cell = todo.popleft()
+        if cell in opened or flagged.flat[cell] or board.has(cell, REVEALED):
+            continue
+        opened.add(cell)
+        if not mines.flat[cell] and counts.flat[cell] == 0:
+            todo.extend(board.neighbors(cell).tolist())
+    return opened
+
+
+@pytest.mark.parametrize('shape', [(1, 1), (1, 7), (9, 9), (16, 30)])
+def test_neighbor_counts(shape):
+    rng = np.random.default_rng(1)
+    for _ in range(5):
+        mines = rng.random(shape) < 0.3
+        assert (neighbor_counts(mines) == brute_counts(mines)).all()
+
+
+def test_neighbor_counts_stack():
+    mines = np.random.default_rng(2).random((4, 8, 5)) < 0.2
+    assert all((neighbor_counts(mines)[n] == brute_counts(mines[n])).all() for n in range(4))
+
+
+@pytest.mark.parametrize('safe_area', [False, True])
+def test_place_mines(safe_area):
+    for seed in range(50):
+        board = Board(Level(16, 30, 99))
+        board.place_mines(250, seed, safe_area)
+        mines = board.mine_indices()
+        assert mines.size == 99 == np.unique(mines).size
+        assert not board.has(250, MINE)
+        if safe_area:
+            assert not board.has(board.neighbors(250), MINE).any()
+        assert (board.counts == brute_counts(board.mines)).all()
+
+
+def test_place_mines_crowded_safe_area():
+    board = Board(Level(4, 4, 12))
+    board.place_mines(5, 1, safe_area=True)
+    assert board.mine_indices().size == 12 and not board.has(5, MINE) and not board.safe_area
+
+
+def test_level_names():
+    for name, level in DEFINED_LEVELS.items():
+        assert level_name(level) == level_key(level) == name
+    assert level_name(Level(20, 30, 100)) == 'custom'
+    assert level_key(Level(20, 30, 100)) == '20x30x100'
+
+
+@pytest.mark.parametrize('level', [Level(9, 9, 10), Level(16, 16, 40), Level(20, 20, 60)])
+def test_board_id_round_trip(level):
+    for seed in range(10):
+        board = Board(level)
+        board.place_mines(seed * 7 % board.size, seed, safe_area=seed % 2 == 0)
+        if seed % 3:
+            board.mirror(seed % 4)
+        again = Board.from_id(board.board_id)
+        assert again.board_id == board.board_id
+        assert (again.state == board.state).all()
+        assert again.first_click == board.first_click
+
+
+@pytest.mark.parametrize('board_id', ['', '9x9x10', '9x9x10:81:1', '9x9:0:1', '0x9x10:0:1', '9x9x10:0:zz', '9x30x10:0:1:5',
+                                      '9x9x0:0:1', '9x9x81:0:1', '9x9x200:0:1', '200000x200000x1:0:1', '2001x2x1:0:1'])
+def test_parse_id_rejects(board_id):
+    with pytest.raises(ValueError):
+        parse_id(board_id)
+
+
+@pytest.mark.parametrize('level', [Level(9, 9, 10), Level(30, 40, 80), Level(600, 500, 3000)])
+def test_reveal(level):
+    assert (level.height * level.width > TABLE_CELLS) == (level == Level(600, 500, 3000))
+    for seed in range(5):
+        board = Board(level)
+        board.place_mines(0, seed, safe_area=True)
+        board.set_mark(int(board.neighbors(board.size - 1)[0]), FLAGGED)
+        expected = brute_reveal(board, 0) if board.size < 10000 else None
+        cells = board.reveal(0)
+        assert np.unique(cells).size == cells.size == board.revealed_count
+        assert set(np.flatnonzero(board.revealed).tolist()) == set(cells.tolist())
+        assert not board.has(cells, MINE | FLAGGED).any()
+        if expected is not None:
+            assert set(cells.tolist()) == expected
+        # a zero cell that is open has every neighbor open, unless flagged
+        zero = board.revealed & (board.counts == 0)
+        for cell in np.flatnonzero(zero)[:2000].tolist():
+            assert board.has(board.neighbors(cell), REVEALED | FLAGGED).all()
+        assert board.reveal(0).size == 0
+
+
+def test_reveal_waves():
+    board = Board(Level(16, 30, 20))
+    board.place_mines(100, 3, safe_area=True)
+    cells = board.copy().reveal(100)
+    waves = board.reveal(100, waves=True)
+    assert sorted(np.concatenate(waves).tolist()) == sorted(cells.tolist())
+    assert waves[0].tolist() == [100]
+
+
+def test_reveal_blocked_by_flag():
+    # an open board split by a wrongly placed flag across it is only opened up to the flag
+    board = Board(Level(5, 9, 1))
+    board.set_mines([44])
+    for row in range(5):
+        board.set_mark(board.index(row, 4), FLAGGED)
+    cells = board.reveal(0)
+    assert set(board.position(cell)[1] for cell in cells.tolist()) == {0, 1, 2, 3}
+    board.set_mark(board.index(2, 4))
+    assert board.position(board.reveal(board.index(2, 4))[-1])[1] > 4
+
+
+def test_reveal_winding_opening():
+    height, width = 101, 60
+    mines = np.zeros((height, width), dtype=bool)
+    for n, row in enumerate(range(4, height - 1, 4)):
+        if n % 2:
+            mines[row, :width - 3] = True
+        else:
+            mines[row, 3:] = True
+    board = Board(Level(height, width, int(mines.sum())))
+    board.set_mines(np.flatnonzero(mines))
+    expected = brute_reveal(board, 0)
+    assert set(board.reveal(0).tolist()) == expected and len(expected) == np.count_nonzero(~mines)
+
+
+@pytest.mark.parametrize('marks, cycle', [(True, [FLAGGED, QUESTIONED, 0, FLAGGED]), (False, [FLAGGED, 0, FLAGGED])])
+def test_cycle_mark(marks, cycle):
+    board = Board(Level(9, 9, 10))
+    board.place_mines(40, 1)
+    for mark in cycle:
+        assert board.cycle_mark(3, marks) == mark
+        assert int(board.state[0, 3]) & (FLAGGED | QUESTIONED) == mark
+    board.set_mark(40)
+    board.reveal(40)
+    assert board.cycle_mark(40, marks) is None and not board.has(40, FLAGGED | QUESTIONED)
+    assert not board.cleared
+    board.set_mark(3)
+    board.reveal(np.flatnonzero(~board.mines & ~board.revealed))
+    assert board.cleared
@@ -0,0 +1,32 @@
+"""
+    Title: Digit Display Tests
+    Description: Checks what the mine counter and timer show, without a display
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+from types import SimpleNamespace
+import pytest
+
+tk = pytest.importorskip('tkinter')
+from minesweeper import DigitDisplay, digit_text
+
+
+@pytest.mark.parametrize('value, text', [(0, '000'), (7, '007'), (42, '042'), (999, '999'), (1000, '999'),
+                                         (123456, '999'), (-1, '-01'), (-99, '-99'), (-100, '-99'), (12.9, '012')])
+def test_digit_text(value, text):
+    assert digit_text(value) == text
+
+
+def test_set_changes_only_new_digits():
+    changed = []
+    display = SimpleNamespace(digits=['left', 'middle', 'right'], text='000', images={str(n): n for n in range(10)},
+                              itemconfigure=lambda item, image: changed.append((item, image)))
+    display.images['minus'] = '-'
+    DigitDisplay.set(display, 5)
+    assert display.text == '005' and changed == [('right', 5)]
+    changed.clear()
+    DigitDisplay.set(display, -15)
+    assert display.text == '-15' and changed == [('left', '-'), ('middle', 1)]
+    changed.clear()
+    DigitDisplay.set(display, -15)
+    assert changed == []
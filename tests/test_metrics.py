@@ -0,0 +1,62 @@
+"""
+    Title: Metrics Tests
+    Description: Checks 3BV and the opening labels against a flood fill done one cell at a time
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import numpy as np
+from board import Board, Level, neighbor_counts
+from metrics import label_openings, three_bv, board_metrics
+
+
+def brute_three_bv(mines):
+    """Click every opening, then every safe cell left covered, and count the clicks"""
+    height, width = mines.shape
+    counts = neighbor_counts(mines)
+    opened = np.zeros(mines.shape, dtype=bool)
+    clicks = openings = 0
+
+    def flood(row, col):
+        todo = [(row, col)]
+        while todo:
+            r, c = todo.pop()
+            if opened[r, c]:
+                continue
+            opened[r, c] = True
+            if counts[r, c] == 0:
+                todo.extend((r + dr, c + dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                            if 0 <= r + dr < height and 0 <= c + dc < width)
+
+    for row in range(height):
+        for col in range(width):
+            if not mines[row, col] and counts[row, col] == 0 and not opened[row, col]:
+                flood(row, col)
+                clicks += 1
+                openings += 1
+    return clicks + np.count_nonzero(~mines & ~opened), openings
+
+
+def test_three_bv():
+    rng = np.random.default_rng(0)
+    for density in (0.05, 0.15, 0.3):
+        mines = rng.random((50, 16, 30)) < density
+        bv, openings = three_bv(mines)
+        for n in range(mines.shape[0]):
+            assert (bv[n], openings[n]) == brute_three_bv(mines[n])
+
+
+def test_label_openings_regions():
+    zero = np.array([[1, 1, 0, 0, 1],
+                     [0, 1, 0, 0, 0],
+                     [0, 0, 0, 1, 0],
+                     [1, 0, 0, 0, 1]], dtype=bool)
+    labels = label_openings(zero)
+    assert (labels[~zero] == zero.size).all()
+    assert set(labels[zero].tolist()) == {0, 4, 13, 15}
+    assert labels[0, 1] == labels[1, 1] == 0 and labels[3, 4] == 13
+
+
+def test_board_metrics():
+    board = Board(Level(16, 30, 99))
+    board.place_mines(0, 5)
+    assert tuple(board_metrics(board)) == brute_three_bv(board.mines)
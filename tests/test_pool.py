@@ -0,0 +1,93 @@
+"""
+    Title: Board Pool Tests
+    Description: Fills no-guess board pools with worker threads and takes boards from them
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+from board import Board, Level, MINE, mirror_cells
+from pool import HEADER, BoardPool, READY, record_dtype
+from solver import solve
+
+LEVEL = Level(9, 9, 10)
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def filled(pool, timeout=30):
+    """Wait for every board the pool has asked for"""
+    deadline = time.monotonic() + timeout
+    while pool.pending:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    return pool
+
+
+def test_take_opens_the_clicked_cell(tmp_path, executor):
+    pool = filled(BoardPool(LEVEL, executor, str(tmp_path), capacity=4))
+    assert pool.ready() == 4 and not pool.failed
+    size = LEVEL.height * LEVEL.width
+    # any cell of a stored opening, as the board is mirrored onto it
+    for symmetry in range(8):
+        record = pool.records[np.flatnonzero(pool.records['state'] == READY)[0]]
+        opening = np.unpackbits(record['opening'], count=size).reshape(LEVEL.height, LEVEL.width).astype(bool)
+        click = int(np.flatnonzero(mirror_cells(opening, symmetry))[-1])
+        board = pool.take(click)
+        assert board is not None
+        assert not board.has(click, MINE) and board.count(click) == 0
+        solved = board.copy()
+        assert solve(solved, click)
+        filled(pool)
+
+
+def test_pooled_board_id_round_trip(tmp_path, executor):
+    pool = filled(BoardPool(LEVEL, executor, str(tmp_path), capacity=2))
+    board = pool.take(int(pool.records['first_click'][0]))
+    assert board is not None
+    regenerated = Board.from_id(board.board_id)
+    assert regenerated.first_click == board.first_click
+    assert (regenerated.mines == board.mines).all()
+
+
+def test_refill_and_reopen(tmp_path, executor):
+    pool = filled(BoardPool(LEVEL, executor, str(tmp_path), capacity=3))
+    taken = pool.take(int(pool.records['first_click'][0]))
+    assert taken is not None
+    # the emptied slot is queued again right away and filled in the background
+    assert pool.ready() + pool.pending == 3
+    assert filled(pool).ready() == 3
+    pool.close()
+    # the stored boards are kept for the next session
+    reopened = BoardPool(LEVEL, executor, str(tmp_path), capacity=3)
+    assert reopened.ready() == 3 and reopened.pending == 0
+    assert (reopened.records['mines'] == pool.records['mines']).all()
+    reopened.close()
+
+
+def test_valid_file(tmp_path, executor):
+    pool = filled(BoardPool(LEVEL, executor, str(tmp_path), capacity=2))
+    pool.close()
+    dtype = record_dtype(LEVEL)
+    assert pool.valid_file(HEADER.pack(b'MSPOOL01', 9, 9, 10, 2), dtype)
+    assert not pool.valid_file(HEADER.pack(b'MSPOOL01', 9, 9, 11, 2), dtype)
+    assert not pool.valid_file(HEADER.pack(b'MSPOOL00', 9, 9, 10, 2), dtype)
+    pool.capacity = 3
+    assert not pool.valid_file(HEADER.pack(b'MSPOOL01', 9, 9, 10, 3), dtype)
+    # a pool file of another capacity is started over
+    resized = BoardPool(LEVEL, executor, str(tmp_path), capacity=3)
+    assert filled(resized).ready() == 3
+    resized.close()
+
+
+def test_crowded_level_fails(tmp_path, executor):
+    pool = filled(BoardPool(Level(2, 2, 2), executor, str(tmp_path), capacity=1))
+    assert pool.failed and pool.ready() == 0
+    assert pool.take(0) is None
+    assert pool.pending == 0
@@ -0,0 +1,37 @@
+"""
+    Title: Profiler Tests
+    Description: Checks the histogram buckets the profiler counts callback durations in
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import pytest
+from profiling import OCTAVES, STEPS, Histogram, bucket, bucket_limit
+
+
+def test_bucket_holds_duration():
+    for microseconds in [*range(5000), *(2 ** k + d for k in range(12, 31) for d in (-1, 0, 1))]:
+        index = bucket(microseconds)
+        assert microseconds < bucket_limit(index)
+        assert index == 0 or bucket_limit(index - 1) <= microseconds
+
+
+def test_bucket_limits():
+    limits = [bucket_limit(index) for index in range(OCTAVES * STEPS)]
+    assert limits == sorted(limits)
+    # past the first octaves a bucket is never more than a quarter wider than where it starts
+    assert all(high <= low * 1.25 for low, high in zip(limits[4 * STEPS:], limits[4 * STEPS + 1:]) if low < high)
+    assert bucket(2 ** 40) == OCTAVES * STEPS - 1
+
+
+def test_histogram_percentiles():
+    histogram = Histogram()
+    for _ in range(90):
+        histogram.add(0.001)
+    for _ in range(10):
+        histogram.add(0.1)
+    summary = histogram.summary()
+    assert summary['count'] == 100 and summary['max_ms'] == pytest.approx(100)
+    assert 1 < summary['p50_ms'] <= 1.25
+    assert 100 < summary['p95_ms'] <= 125
+    assert sum(summary['buckets_us'].values()) == 100
+    assert Histogram().percentile(50) == 0.0
@@ -0,0 +1,88 @@
+"""
+    Title: Replay Tests
+    Description: Round-trips recorded games through their files and verifies them headless
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import os
+import numpy as np
+import pytest
+from board import Board, Level, REVEALED, FLAGGED
+from replay import Replay, ReplayRecorder, prune, verify, PRESS, RELEASE, FLAG, CHORD
+
+
+def play(board):
+    """Return the inputs that clear a board: a flag on one mine and a click on each covered safe cell"""
+    inputs = [(FLAG, int(board.mine_indices()[0]))]
+    played = board.copy()
+    for cell in np.flatnonzero(~played.mines).tolist():
+        if not played.has(cell, REVEALED):
+            inputs += [(PRESS, cell), (RELEASE, cell)]
+            played.reveal(cell)
+    return inputs
+
+
+def record(filename, board, inputs, marks=True):
+    recorder = ReplayRecorder(filename, board.board_id, marks)
+    for action, cell in inputs:
+        recorder.record(action, cell)
+    recorder.close()
+
+
+def test_replay_round_trip(tmp_path):
+    board = Board(Level(16, 16, 40))
+    board.place_mines(17, 11, safe_area=True)
+    inputs = [(PRESS, 3), (RELEASE, None)] + play(board)
+    filename = str(tmp_path / 'game.msr')
+    record(filename, board, inputs)
+    replay = Replay(filename, chunk=3)
+    assert replay.board_id == board.board_id and replay.marks
+    assert [(event.action, event.cell) for event in replay] == inputs
+    won, seconds, moves = verify(filename)
+    assert won and seconds is not None and moves == sum(action == PRESS for action, _ in inputs)
+
+
+def test_replay_loss_and_chord(tmp_path):
+    board = Board(Level(9, 9, 10))
+    board.place_mines(0, 4)
+    mine = int(board.mine_indices()[0])
+    filename = str(tmp_path / 'lost.msr')
+    record(filename, board, [(PRESS, 0), (RELEASE, 0), (CHORD, 0), (PRESS, mine), (RELEASE, mine)])
+    assert not verify(filename).won and verify(filename).seconds is not None
+
+
+def test_replay_rejects_other_files(tmp_path):
+    filename = tmp_path / 'other.msr'
+    filename.write_bytes(b'not a replay at all')
+    with pytest.raises(ValueError):
+        Replay(str(filename))
+
+
+
+def test_resumed_replay(tmp_path):
+    board = Board(Level(16, 16, 40))
+    board.place_mines(17, 2, safe_area=True)
+    board.reveal(17)
+    board.set_mark(int(board.mine_indices()[0]), FLAGGED)
+    filename = str(tmp_path / 'resumed.msr')
+    recorder = ReplayRecorder(filename, board.board_id, False, None, board.state, 30.0, 5, 7)
+    for action, cell in play(board)[1:]:
+        recorder.record(action, cell)
+    recorder.close()
+    replay = Replay(filename)
+    assert (replay.seconds, replay.moves, replay.clicks) == (30.0, 5, 7)
+    assert (replay.board().state == board.state).all()
+    won, seconds, moves = verify(filename)
+    assert won and moves == 5 + sum(action == PRESS for action, _ in play(board))
+
+
+def test_prune(tmp_path):
+    for number in range(5):
+        filename = tmp_path / f'{number}.msr'
+        filename.write_bytes(b'')
+        os.utime(filename, (number, number))
+    (tmp_path / 'notes.txt').write_text('kept')
+    prune(str(tmp_path), 2)
+    assert sorted(name.name for name in tmp_path.iterdir()) == ['3.msr', '4.msr', 'notes.txt']
+    prune(str(tmp_path), 5)
+    assert len(list(tmp_path.iterdir())) == 3
@@ -0,0 +1,48 @@
+"""
+    Title: Saved Game Tests
+    Description: Round-trips games in progress through the save file
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import numpy as np
+import pytest
+from board import Board, Level, FLAGGED, QUESTIONED
+from savegame import HEADERS, MAGIC, load_game, save_game
+
+
+def test_savegame_round_trip(tmp_path):
+    board = Board(Level(20, 24, 70))
+    board.place_mines(50, 9, safe_area=True)
+    board.mirror(3)
+    board.reveal(board.first_click)
+    covered = np.flatnonzero(~board.revealed & ~board.mines)
+    board.set_mark(int(covered[0]), FLAGGED)
+    board.set_mark(int(covered[-1]), QUESTIONED)
+    filename = str(tmp_path / 'savegame.mss')
+    save_game(filename, board, 12.5, 3, False, 4)
+    saved = load_game(filename)
+    assert (saved.seconds, saved.moves, saved.marks, saved.clicks) == (12.5, 3, False, 4)
+    assert saved.board.board_id == board.board_id
+    assert saved.board.first_click == board.first_click
+    assert saved.board.revealed_count == board.revealed_count
+    assert (saved.board.state == board.state).all()
+
+
+def test_savegame_rejects_other_files(tmp_path):
+    filename = tmp_path / 'savegame.mss'
+    filename.write_bytes(b'MSREPLAY' + bytes(40))
+    with pytest.raises(ValueError):
+        load_game(str(filename))
+
+
+def test_savegame_version_1(tmp_path):
+    board = Board(Level(9, 9, 10))
+    board.place_mines(40, 6)
+    board.reveal(40)
+    board_id = board.board_id.encode('ascii')
+    filename = tmp_path / 'savegame.mss'
+    filename.write_bytes(HEADERS[1].pack(MAGIC, 1, 1, 4, board.first_click, 8.0, len(board_id)) + board_id + board.state.tobytes())
+    saved = load_game(str(filename))
+    # version 1 had no click count; every move was at least one
+    assert (saved.seconds, saved.moves, saved.marks, saved.clicks) == (8.0, 4, True, 4)
+    assert (saved.board.state == board.state).all()
@@ -0,0 +1,79 @@
+"""
+    Title: Score Store Tests
+    Description: Checks the leaderboard and history queries of the SQLite score store, the import
+                 of the old pickle and the schema upgrade
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import sqlite3
+from datetime import datetime, timedelta
+from os import path
+from scores import ScoreStore, SCHEMA_VERSION
+
+LEGACY = path.join(path.dirname(path.dirname(path.abspath(__file__))), 'highscores.data')
+
+
+def open_store(tmp_path, legacy='missing.data'):
+    return ScoreStore(str(tmp_path / 'scores.db'), str(tmp_path / legacy))
+
+
+def test_leaderboard(tmp_path):
+    store = open_store(tmp_path)
+    slow = store.record('expert', True, 120.0, 'A', bv=150, openings=20, clicks=180)
+    fast = store.record('expert', True, 90.0, 'B')
+    store.record('expert', False, 10.0, 'C')
+    store.record('9x9x20', True, 5.0, 'D')
+    assert [score.id for score in store.top('expert')] == [fast, slow]
+    assert store.rank(slow) == 2 and store.best('expert').name == 'B'
+    assert store.levels() == ['expert', '9x9x20']
+    assert store.top('expert')[1].bv == 150
+    store.close()
+
+
+def test_history(tmp_path):
+    store = open_store(tmp_path)
+    won = store.record('beginner', True, 12.0, 'A')
+    lost = store.record('expert', False, 3.0, 'A')
+    store.record('beginner', True, 9.0, 'B')
+    assert {score.id for score in store.by_player('A')} == {won, lost}
+    assert store.by_player('A', limit=1)[0].name == 'A'
+    now = datetime.now()
+    assert len(store.between(now - timedelta(minutes=1), now + timedelta(minutes=1))) == 3
+    assert [score.id for score in store.between(now - timedelta(minutes=1), now + timedelta(minutes=1), 'expert')] == [lost]
+    assert store.between(now + timedelta(minutes=1), now + timedelta(minutes=2)) == []
+    store.rename(won, 'C')
+    assert store.by_player('C')[0].id == won
+    store.reset()
+    assert store.by_player('B') == []
+    store.close()
+
+
+def test_legacy_import(tmp_path):
+    with open(LEGACY, 'rb') as f:
+        (tmp_path / 'highscores.data').write_bytes(f.read())
+    store = open_store(tmp_path, 'highscores.data')
+    imported = [score for level in ('beginner', 'intermediate', 'expert') for score in store.top(level)]
+    assert imported and all(score.won and score.seconds < 999 for score in imported)
+    store.close()
+    # the pickle is imported only once
+    store = open_store(tmp_path, 'highscores.data')
+    assert len([score for level in ('beginner', 'intermediate', 'expert') for score in store.top(level)]) == len(imported)
+    store.close()
+
+
+def test_upgrade_from_version_1(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / 'scores.db'))
+    conn.executescript("""
+        CREATE TABLE games (id INTEGER PRIMARY KEY, level TEXT NOT NULL, won INTEGER NOT NULL, seconds REAL NOT NULL,
+                            name TEXT NOT NULL, played TEXT NOT NULL, board_id TEXT);
+        INSERT INTO games (level, won, seconds, name, played) VALUES ('expert', 1, 80.0, 'Old', '2020-05-29 12:00:00');
+        PRAGMA user_version=1;
+    """)
+    conn.close()
+    store = open_store(tmp_path)
+    assert store.conn.execute('PRAGMA user_version').fetchone()[0] == SCHEMA_VERSION
+    old = store.best('expert')
+    assert old.name == 'Old' and old.bv is None
+    store.record('expert', True, 70.0, 'New', bv=120, openings=10, clicks=140)
+    assert store.best('expert').bv == 120
+    store.close()
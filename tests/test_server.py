@@ -0,0 +1,65 @@
+"""
+    Title: Automation Server Tests
+    Description: Plays headless sessions through the server's commands, including malformed ones
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import json
+import socket
+import pytest
+from server import Connection, Server, Session, handle
+
+
+def answer(connection, line):
+    return json.loads(connection.answer(line.encode() if isinstance(line, str) else line))
+
+
+def test_session_plays_to_the_end():
+    session = Session()
+    reply = handle(session, {'cmd': 'new', 'level': [9, 9, 10], 'seed': 4})
+    assert reply['ok'] and reply['status'] == 'ready'
+    reply = handle(session, {'cmd': 'reveal', 'cells': [0]})
+    assert reply['ok'] and reply['status'] in ('playing', 'won') and 0 in reply['cells']
+    safe = [cell for cell in range(81) if not session.board.mines.flat[cell]]
+    reply = handle(session, {'cmd': 'reveal', 'cells': safe})
+    assert reply['status'] == 'won'
+    assert handle(session, {'cmd': 'query'})['values'].count('.') == 0
+
+
+@pytest.mark.parametrize('line', ['{"cmd":"reveal","cells":[1e400]}', '{"cmd":"new","seed":1e400}', '{"cmd":"new","seed":-1}',
+                                  '{"cmd":"new","level":[1e400,9,10]}', '{"cmd":"new","level":[200000,200000,1]}',
+                                  '{"cmd":"new","board_id":"9x9x200:0:1"}', '{"cmd":"new","board_id":123}',
+                                  '{"cmd":"chord","cell":[]}', '5', '{"cmd":"dance"}',
+                                  pytest.param('[' * 100000 + ']' * 100000, id='nested'), 'not json'])
+def test_bad_commands_are_answered(line):
+    connection = Connection(Session())
+    assert answer(connection, '{"cmd":"new","seed":3}')['ok']
+    replies = answer(connection, line)
+    assert all(not reply['ok'] for reply in (replies if isinstance(replies, list) else [replies]))
+    # the game in progress is untouched and still playable
+    reply = answer(connection, '{"cmd":"reveal","cells":[40]}')
+    assert reply['ok'] and reply['status'] != 'ready'
+
+
+def test_server_survives_bad_input(tmp_path):
+    address = 'unix:' + str(tmp_path / 'mines.sock')
+    server = Server(address)
+    try:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(address[5:])
+        client.sendall(b'{"cmd":"reveal","cells":[1e400]}\n{"cmd":"query"}\n')
+        client.setblocking(False)
+        data = b''
+        for _ in range(100):
+            if data.count(b'\n') == 2:
+                break
+            server.poll(0.05)
+            try:
+                data += client.recv(65536)
+            except BlockingIOError:
+                pass
+        first, second = (json.loads(line) for line in data.splitlines())
+        assert not first['ok'] and second['ok']
+        client.close()
+    finally:
+        server.close()
@@ -0,0 +1,50 @@
+"""
+    Title: Simulator Tests
+    Description: Checks the batched board generation and first-click flood against single boards
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+import numpy as np
+import pytest
+from board import Board, Level, neighbor_counts
+from simulate import generate_batch, reveal_batch, simulate
+
+
+@pytest.mark.parametrize('safe_area', [False, True])
+def test_generate_batch(safe_area):
+    level = Level(16, 30, 99)
+    board = Board(level)
+    mines = generate_batch(level, 200, np.random.default_rng(5), 45, safe_area)
+    assert mines.shape == (200, 16, 30)
+    assert (mines.sum(axis=(1, 2)) == 99).all()
+    clear = board.neighbors(45) if safe_area else []
+    assert not mines.reshape(200, -1)[:, [45, *clear]].any()
+    # every board is a different layout
+    assert len({layout.tobytes() for layout in mines}) == 200
+
+
+@pytest.mark.parametrize('level, first_click', [(Level(9, 9, 10), 40), (Level(16, 30, 99), 0), (Level(20, 7, 12), 139)])
+def test_reveal_batch_matches_board(level, first_click):
+    mines = generate_batch(level, 100, np.random.default_rng(2), first_click)
+    counts = neighbor_counts(mines)
+    revealed = reveal_batch(mines, counts, first_click)
+    for layout, counted, opened in zip(mines, counts, revealed):
+        board = Board(level)
+        board.set_mines(np.flatnonzero(layout))
+        assert (board.counts == counted).all()
+        board.reveal(first_click)
+        assert (board.revealed == opened).all()
+
+
+def test_simulate_summary():
+    level = Level(9, 9, 10)
+    stats = simulate(level, 300, seed=3, safe_area=True, batch_size=128, solver_sample=20)
+    assert stats['boards'] == 300 and stats['first_click'] == 40
+    # a clear 3x3 area always opens more than the clicked cell
+    assert stats['first_click_zero_rate'] == 1.0
+    assert sum(stats['number_cells'].values()) == 300 * (81 - 10)
+    assert 0 <= stats['solver_win_rate'] <= 1
+    # the same seed gives the same boards
+    again = simulate(level, 300, seed=3, safe_area=True, batch_size=128)
+    assert again['bv_mean'] == stats['bv_mean']
+    assert again['opening_size_percentiles'] == stats['opening_size_percentiles']
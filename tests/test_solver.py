@@ -0,0 +1,37 @@
+"""
+    Title: Solver Tests
+    Description: Checks that hints and no-guess boards only ever rely on proven cells
+    Author: Israel Dryer
+    Modified: 2026-10-16
+"""
+from board import Board, Level, DEFINED_LEVELS, MINE, REVEALED
+from solver import Solver, hint, solve, generate_no_guess
+
+
+def opened(seed, first_click=40):
+    board = Board(DEFINED_LEVELS['beginner'])
+    board.place_mines(first_click, seed)
+    board.reveal(first_click)
+    return board
+
+
+def test_hint_after_mines_only_pass():
+    # the first pass on this board proves only mines; the safe cells follow from them
+    board = opened(0)
+    safe, mines = Solver(board.copy()).deduce()
+    assert not safe and mines
+    assert hint(board) == 14
+
+
+def test_hint_is_safe():
+    for seed in range(300):
+        board = opened(seed)
+        index = hint(board)
+        if index is not None:
+            assert not board.has(index, MINE | REVEALED)
+
+
+def test_no_guess_board_is_solved():
+    board = generate_no_guess(Level(16, 16, 40), 100, seed=3)
+    assert not board.has(board.neighbors(100), MINE).any()
+    assert solve(board.copy())